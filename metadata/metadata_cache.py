@@ -6,9 +6,10 @@ Central service for managing unified package metadata cache with fast FTS search
 
 import sqlite3
 import os
-from typing import List, Optional, Iterator
+import threading
+from typing import Dict, List, Optional, Iterator
 from datetime import datetime
-from core.models import UniversalPackageMetadata, PackageManager
+from core.models import UniversalPackageMetadata, PackageManager, Package
 from .providers.base import MetadataProvider
 
 
@@ -23,6 +24,9 @@ class MetadataCacheService:
     - Fast search across all registered package managers
     """
 
+    # Values per IN (...) query, kept under SQLite's default variable limit
+    _IN_BATCH_SIZE = 500
+
     def __init__(self, cache_db_path: str):
         """
         Initialize the metadata cache service.
@@ -32,14 +36,46 @@ class MetadataCacheService:
         """
         self.cache_db_path = cache_db_path
         self.providers: List[MetadataProvider] = []
+        # Serializes cache writes so providers can be refreshed from several threads
+        self._write_lock = threading.Lock()
+        # One SQLite connection per thread, kept open between calls
+        self._local = threading.local()
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's cache connection, opening it on first use.
+
+        Reusing the connection keeps SQLite's page cache and compiled
+        statements warm instead of reopening the database for every query.
+        WAL lets searches read while a refresh worker is writing.
+
+        Returns:
+            sqlite3.Connection owned by the current thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.cache_db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close the calling thread's cache connection (if open)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_database(self):
         """Initialize the cache database schema."""
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(self.cache_db_path), exist_ok=True)
 
-        conn = sqlite3.connect(self.cache_db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Main packages table
@@ -113,7 +149,6 @@ class MetadataCacheService:
         """)
 
         conn.commit()
-        conn.close()
 
         print(f"[MetadataCache] Initialized database: {self.cache_db_path}")
 
@@ -228,9 +263,9 @@ class MetadataCacheService:
         Returns:
             List of matching UniversalPackageMetadata objects
         """
-        conn = sqlite3.connect(self.cache_db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._connect()
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         # Sanitize query for FTS5: quote special characters
         # FTS5 special chars: " - ( ) : * AND OR NOT
@@ -265,8 +300,6 @@ class MetadataCacheService:
         for row in cursor.fetchall():
             results.append(self._row_to_package(row))
 
-        conn.close()
-
         return results
 
     def get_package_count(self, manager: Optional[str] = None) -> int:
@@ -279,7 +312,7 @@ class MetadataCacheService:
         Returns:
             Package count
         """
-        conn = sqlite3.connect(self.cache_db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if manager:
@@ -288,10 +321,25 @@ class MetadataCacheService:
             cursor.execute("SELECT COUNT(*) FROM packages")
 
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count
 
+    def get_package_counts(self) -> Dict[str, int]:
+        """
+        Get counts of cached packages for every manager in one query.
+
+        Returns:
+            Dict mapping manager name to package count (managers with no
+            cached packages are absent)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT manager, COUNT(*) FROM packages GROUP BY manager")
+        counts = {manager: count for manager, count in cursor.fetchall()}
+
+        return counts
+
     def get_cache_freshness(self, manager: str) -> Optional[datetime]:
         """
         Get the last cache update timestamp for a specific manager.
@@ -302,7 +350,7 @@ class MetadataCacheService:
         Returns:
             datetime of last cache update, or None if no cache exists
         """
-        conn = sqlite3.connect(self.cache_db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -311,12 +359,35 @@ class MetadataCacheService:
         """, (manager,))
 
         result = cursor.fetchone()[0]
-        conn.close()
 
         if result:
             return datetime.fromtimestamp(result)
         return None
 
+    def get_cache_freshness_all(self) -> Dict[str, datetime]:
+        """
+        Get the last cache update timestamp for every manager in one query.
+
+        Returns:
+            Dict mapping manager name to datetime of last cache update
+            (managers with no cache are absent)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT manager, MAX(cache_timestamp) FROM packages
+            WHERE is_installed = 0
+            GROUP BY manager
+        """)
+
+        freshness = {
+            manager: datetime.fromtimestamp(timestamp)
+            for manager, timestamp in cursor.fetchall() if timestamp
+        }
+
+        return freshness
+
     def _clear_manager_cache(self, manager: str):
         """
         Clear all cached packages for a specific manager.
@@ -324,13 +395,10 @@ class MetadataCacheService:
         Args:
             manager: Manager name
         """
-        conn = sqlite3.connect(self.cache_db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM packages WHERE manager = ?", (manager,))
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+            cursor.execute("DELETE FROM packages WHERE manager = ?", (manager,))
 
     def _insert_package(self, package: UniversalPackageMetadata):
         """
@@ -339,35 +407,32 @@ class MetadataCacheService:
         Args:
             package: UniversalPackageMetadata to insert
         """
-        conn = sqlite3.connect(self.cache_db_path)
-        cursor = conn.cursor()
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-        INSERT OR REPLACE INTO packages (
-            package_id, name, version, manager,
-            description, author, publisher, homepage, license,
-            extra_metadata, search_tokens, tags,
-            cache_timestamp, is_installed
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            package.package_id,
-            package.name,
-            package.version,
-            package.manager.value,
-            package.description,
-            package.author,
-            package.publisher,
-            package.homepage,
-            package.license,
-            package.extra_metadata,
-            package.search_tokens,
-            package.tags,
-            int(package.cache_timestamp.timestamp()) if package.cache_timestamp else None,
-            1 if package.is_installed else 0
-        ))
-
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+            INSERT OR REPLACE INTO packages (
+                package_id, name, version, manager,
+                description, author, publisher, homepage, license,
+                extra_metadata, search_tokens, tags,
+                cache_timestamp, is_installed
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                package.package_id,
+                package.name,
+                package.version,
+                package.manager.value,
+                package.description,
+                package.author,
+                package.publisher,
+                package.homepage,
+                package.license,
+                package.extra_metadata,
+                package.search_tokens,
+                package.tags,
+                int(package.cache_timestamp.timestamp()) if package.cache_timestamp else None,
+                1 if package.is_installed else 0
+            ))
 
     def sync_installed_packages_from_registry(self, validate: bool = True):
         """
@@ -422,9 +487,9 @@ class MetadataCacheService:
         Returns:
             List of UniversalPackageMetadata objects for installed packages
         """
-        conn = sqlite3.connect(self.cache_db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._connect()
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         query = "SELECT * FROM packages WHERE is_installed = 1"
         params = []
@@ -441,7 +506,6 @@ class MetadataCacheService:
         cursor.execute(query, params)
         packages = [self._row_to_package(row) for row in cursor.fetchall()]
 
-        conn.close()
         return packages
 
     def get_manager_for_package(self, package_id: str, package_name: str = None) -> Optional[str]:
@@ -459,7 +523,7 @@ class MetadataCacheService:
         Returns:
             Manager name (winget, chocolatey, etc.) or None if not found in repos
         """
-        conn = sqlite3.connect(self.cache_db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Try exact package_id match first
@@ -471,7 +535,6 @@ class MetadataCacheService:
 
         row = cursor.fetchone()
         if row:
-            conn.close()
             return row[0]
 
         # Try case-insensitive package_id match
@@ -483,7 +546,6 @@ class MetadataCacheService:
 
         row = cursor.fetchone()
         if row:
-            conn.close()
             return row[0]
 
         # If package_name provided, try name match as fallback
@@ -496,12 +558,108 @@ class MetadataCacheService:
 
             row = cursor.fetchone()
             if row:
-                conn.close()
                 return row[0]
 
-        conn.close()
         return None
 
+    def get_managers_for_packages(self, packages: List[UniversalPackageMetadata]) -> Dict[str, str]:
+        """
+        Batched form of get_manager_for_package().
+
+        Resolves all packages over one connection with a few IN queries
+        instead of up to three queries per package. Matching order is the
+        same: exact package_id, case-insensitive package_id, then name.
+
+        Args:
+            packages: Packages to resolve
+
+        Returns:
+            Dict mapping package_id to manager name for packages found in repos
+        """
+        resolved: Dict[str, str] = {}
+        if not packages:
+            return resolved
+
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        def lookup(column: str, keys: Dict[str, List[str]], fold_case: bool = False):
+            # keys maps a lookup value to the package_ids it resolves
+            values = list(keys)
+            for start in range(0, len(values), self._IN_BATCH_SIZE):
+                chunk = values[start:start + self._IN_BATCH_SIZE]
+                chunk_keys = keys
+                if fold_case:
+                    # Fold with SQLite's LOWER() so both sides of the match
+                    # agree (it only folds ASCII, unlike str.lower())
+                    cursor.execute(f"SELECT {','.join(['LOWER(?)'] * len(chunk))}", chunk)
+                    chunk_keys = {}
+                    for value, folded in zip(chunk, cursor.fetchone()):
+                        chunk_keys.setdefault(folded, []).extend(keys[value])
+                    chunk = list(chunk_keys)
+                    column_sql = f"LOWER({column})"
+                else:
+                    column_sql = column
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT {column_sql}, manager FROM packages
+                    WHERE {column_sql} IN ({placeholders}) AND is_installed = 0
+                """, chunk)
+                for value, manager in cursor.fetchall():
+                    for package_id in chunk_keys.get(value, ()):
+                        resolved.setdefault(package_id, manager)
+
+        # Try exact package_id match first
+        lookup("package_id", {pkg.package_id: [pkg.package_id] for pkg in packages})
+
+        # Try case-insensitive package_id match
+        by_id: Dict[str, List[str]] = {}
+        for pkg in packages:
+            if pkg.package_id not in resolved:
+                by_id.setdefault(pkg.package_id, []).append(pkg.package_id)
+        if by_id:
+            lookup("package_id", by_id, fold_case=True)
+
+        # Name match as fallback
+        by_name: Dict[str, List[str]] = {}
+        for pkg in packages:
+            if pkg.package_id not in resolved and pkg.name:
+                by_name.setdefault(pkg.name, []).append(pkg.package_id)
+        if by_name:
+            lookup("name", by_name, fold_case=True)
+
+        return resolved
+
+    def build_packages(self, metadata_list: List[UniversalPackageMetadata]) -> List[Package]:
+        """
+        Convert cached metadata to Package objects in one pass.
+
+        Equivalent to calling to_package(cache_service=self) on each item,
+        but UNKNOWN managers are resolved with a single batched lookup.
+
+        Args:
+            metadata_list: UniversalPackageMetadata objects to convert
+
+        Returns:
+            Package objects in the same order
+        """
+        unresolved = [
+            metadata for metadata in metadata_list
+            if metadata.manager == PackageManager.UNKNOWN and metadata.is_installed
+        ]
+        repo_managers = self.get_managers_for_packages(unresolved)
+
+        packages = []
+        for metadata in metadata_list:
+            package = metadata.to_package()
+            if package.manager == PackageManager.UNKNOWN and metadata.is_installed:
+                repo_manager = repo_managers.get(metadata.package_id)
+                if repo_manager:
+                    package.manager = PackageManager(repo_manager)
+                    print(f"[SmartManager] Resolved {metadata.name}: unknown -> {repo_manager}")
+            packages.append(package)
+        return packages
+
     def _update_installed_state(self, packages: List):
         """
         Update cache with installed package state from registry scan.
@@ -514,57 +672,54 @@ class MetadataCacheService:
         Args:
             packages: List of PackageMetadata objects from registry scan
         """
-        conn = sqlite3.connect(self.cache_db_path)
-        cursor = conn.cursor()
-
-        # Clear existing installed flags
-        cursor.execute("UPDATE packages SET is_installed = 0")
-        print("[MetadataCache] Cleared existing installed flags")
-
-        # Insert or update packages
-        for pkg in packages:
-            # Try to find existing package in cache by ID and manager
-            cursor.execute("""
-                SELECT id FROM packages
-                WHERE package_id = ? AND manager = ?
-            """, (pkg.package_id, pkg.manager.value))
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.cursor()
 
-            existing = cursor.fetchone()
+            # Clear existing installed flags
+            cursor.execute("UPDATE packages SET is_installed = 0")
+            print("[MetadataCache] Cleared existing installed flags")
 
-            if existing:
-                # Update existing package with installed state
+            # Insert or update packages
+            for pkg in packages:
+                # Try to find existing package in cache by ID and manager
                 cursor.execute("""
-                    UPDATE packages SET
-                        is_installed = 1,
-                        installed_version = ?,
-                        install_date = ?,
-                        install_source = ?,
-                        install_location = ?
+                    SELECT id FROM packages
                     WHERE package_id = ? AND manager = ?
-                """, (pkg.installed_version, pkg.install_date, pkg.install_source,
-                      pkg.install_location, pkg.package_id, pkg.manager.value))
-            else:
-                # Insert new package (not in available repos - manual install)
-                cursor.execute("""
-                    INSERT INTO packages (
-                        package_id, name, version, manager, description,
-                        author, publisher, homepage, license,
-                        extra_metadata, search_tokens, tags, cache_timestamp,
-                        is_installed, installed_version, install_date,
-                        install_source, install_location
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)
-                """, (
-                    pkg.package_id, pkg.name, pkg.version, pkg.manager.value,
-                    pkg.description or "", pkg.author or "", pkg.publisher or "",
-                    pkg.homepage or "", pkg.license or "", pkg.extra_metadata or "",
-                    pkg.search_tokens or "", ','.join(pkg.tags) if pkg.tags else "",
-                    int(datetime.now().timestamp()),
-                    pkg.installed_version, pkg.install_date,
-                    pkg.install_source, pkg.install_location
-                ))
-
-        conn.commit()
-        conn.close()
+                """, (pkg.package_id, pkg.manager.value))
+
+                existing = cursor.fetchone()
+
+                if existing:
+                    # Update existing package with installed state
+                    cursor.execute("""
+                        UPDATE packages SET
+                            is_installed = 1,
+                            installed_version = ?,
+                            install_date = ?,
+                            install_source = ?,
+                            install_location = ?
+                        WHERE package_id = ? AND manager = ?
+                    """, (pkg.installed_version, pkg.install_date, pkg.install_source,
+                          pkg.install_location, pkg.package_id, pkg.manager.value))
+                else:
+                    # Insert new package (not in available repos - manual install)
+                    cursor.execute("""
+                        INSERT INTO packages (
+                            package_id, name, version, manager, description,
+                            author, publisher, homepage, license,
+                            extra_metadata, search_tokens, tags, cache_timestamp,
+                            is_installed, installed_version, install_date,
+                            install_source, install_location
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)
+                    """, (
+                        pkg.package_id, pkg.name, pkg.version, pkg.manager.value,
+                        pkg.description or "", pkg.author or "", pkg.publisher or "",
+                        pkg.homepage or "", pkg.license or "", pkg.extra_metadata or "",
+                        pkg.search_tokens or "", ','.join(pkg.tags) if pkg.tags else "",
+                        int(datetime.now().timestamp()),
+                        pkg.installed_version, pkg.install_date,
+                        pkg.install_source, pkg.install_location
+                    ))
 
     def _row_to_package(self, row: sqlite3.Row) -> UniversalPackageMetadata:
         """
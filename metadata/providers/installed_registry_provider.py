@@ -132,13 +132,20 @@ class InstalledRegistryProvider:
         Returns:
             RegistryPackageInfo object or None
         """
+        # Read all values in one enumeration pass instead of a
+        # QueryValueEx (and FileNotFoundError) per missing field
+        values = {}
+        for i in range(winreg.QueryInfoKey(app_key)[1]):
+            try:
+                name, data, _ = winreg.EnumValue(app_key, i)
+            except OSError:
+                break
+            values[name] = data
+
         def get_value(name: str) -> Optional[str]:
             """Get registry value, return None if not found."""
-            try:
-                value = winreg.QueryValueEx(app_key, name)[0]
-                return value.strip() if value and isinstance(value, str) else value
-            except FileNotFoundError:
-                return None
+            value = values.get(name)
+            return value.strip() if value and isinstance(value, str) else value
 
         # Get display name (required)
         display_name = get_value("DisplayName")
@@ -4,6 +4,7 @@ Reusable UI components for WinPacMan PyQt6 GUI.
 This module provides custom widgets and components using PyQt6 and Fluent Design.
 """
 
-from .package_table import PackageTableWidget
+from .package_table import PackageTableWidget, PackageTableModel
+from .cache_summary import CacheSummaryModel
 
-__all__ = ['PackageTableWidget']
+__all__ = ['PackageTableWidget', 'PackageTableModel', 'CacheSummaryModel']
@@ -0,0 +1,103 @@
+"""
+Table model for the Cache Summary dialog.
+
+Provides a lightweight QAbstractTableModel holding one tuple per row, so the
+summary can be rebuilt with a single model reset instead of recreating a
+QTableWidgetItem for every cell.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QBrush
+from typing import List, Tuple
+
+# Roles and alignment used in CacheSummaryModel.data(), resolved once
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+
+class CacheSummaryModel(QAbstractTableModel):
+    """
+    Table model for per-provider cache counts.
+
+    Each row is a (kind, cells) tuple where kind is one of 'provider',
+    'separator', 'installed' or 'total' and cells holds the display text of
+    the first three columns. The fourth column is reserved for the refresh
+    button the dialog places on provider rows.
+    """
+
+    HEADERS = ["Provider", "Package Count", "Last Updated", "Actions"]
+
+    def __init__(self, parent=None):
+        """Initialize an empty summary model."""
+        super().__init__(parent)
+        self._rows: List[Tuple[str, Tuple[str, str, str]]] = []
+
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._separator_brush = QBrush(Qt.GlobalColor.lightGray)
+
+    def set_rows(self, rows: List[Tuple[str, Tuple[str, str, str]]]):
+        """
+        Replace the model contents.
+
+        Args:
+            rows: List of (kind, (name, count, freshness)) tuples
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_kind(self, row: int) -> str:
+        """
+        Get the row type tag.
+
+        Args:
+            row: Row index
+
+        Returns:
+            'provider', 'separator', 'installed', 'total' or '' if out of range
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return ''
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of summary rows (no child rows)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of display columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return cell text and per-row styling."""
+        if not index.isValid():
+            return None
+
+        kind, cells = self._rows[index.row()]
+        column = index.column()
+
+        if role == _DISPLAY_ROLE:
+            if kind == 'separator' or column >= len(cells):
+                return ""
+            return cells[column]
+        if role == _ALIGNMENT_ROLE:
+            if column in (1, 2):
+                return _ALIGN_CENTER
+        elif role == _FONT_ROLE:
+            if kind in ('installed', 'total') and column < 3:
+                return self._bold_font
+        elif role == _BACKGROUND_ROLE:
+            if kind == 'separator':
+                return self._separator_brush
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return column headers."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
@@ -1,23 +1,126 @@
 """
 Enhanced package table widget with color coding.
 
-Provides a custom table widget for displaying packages with manager-specific
-color coding and sorting capabilities.
+Provides a custom table view for displaying packages with manager-specific
+color coding and sorting capabilities. Rows are served on demand from a
+QAbstractTableModel, so only the visible cells are ever materialized.
 """
 
 from PyQt6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu
+    QTableView, QHeaderView, QAbstractItemView, QMenu
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QAction
 from typing import List, Optional
 
 from core.models import Package, PackageManager, PackageStatus
 
 
-class PackageTableWidget(QTableWidget):
+# Item roles used in PackageTableModel.data(), resolved once instead of
+# walking the Qt enum attributes for every cell the view paints
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# Display names for package manager enum values
+MANAGER_DISPLAY_NAMES = {
+    'winget': 'WinGet',
+    'chocolatey': 'Chocolatey',
+    'pip': 'Pip',
+    'npm': 'NPM',
+    'cargo': 'Cargo',
+    'scoop': 'Scoop',
+    'msstore': 'MS Store',
+    'unknown': 'Unknown'
+}
+
+
+class PackageTableModel(QAbstractTableModel):
     """
-    Custom table widget for displaying packages with color coding.
+    Table model backed by a list of Package objects.
+
+    Cell text is produced in data() when the view asks for it, instead of
+    creating an item per cell up front.
+    """
+
+    HEADERS = ["Package Name", "Version", "Manager", "Description"]
+
+    def __init__(self, parent=None):
+        """Initialize an empty package model."""
+        super().__init__(parent)
+        self._packages: List[Package] = []
+
+    def set_packages(self, packages: List[Package]):
+        """
+        Replace the model contents.
+
+        Args:
+            packages: List of Package objects to expose
+        """
+        self.beginResetModel()
+        self._packages = packages
+        self.endResetModel()
+
+    def package_at(self, row: int) -> Optional[Package]:
+        """
+        Get the package for a model row.
+
+        Args:
+            row: Row index in this (unsorted) model
+
+        Returns:
+            Package object or None if the row is out of range
+        """
+        if 0 <= row < len(self._packages):
+            return self._packages[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of packages (no child rows)."""
+        return 0 if parent.isValid() else len(self._packages)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of display columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return cell text, or the Package object for UserRole."""
+        if not index.isValid():
+            return None
+
+        package = self._packages[index.row()]
+
+        if role == _DISPLAY_ROLE:
+            column = index.column()
+            if column == 0:
+                return package.name
+            if column == 1:
+                return package.version
+            if column == 2:
+                # Manager - show the actual package manager name
+                manager_value = package.manager.value
+                return MANAGER_DISPLAY_NAMES.get(manager_value, manager_value.capitalize())
+            if column == 3:
+                return package.description or ""
+        elif role == _USER_ROLE:
+            return package
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return left-aligned column headers."""
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.HEADERS[section]
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        return super().headerData(section, orientation, role)
+
+
+class PackageTableWidget(QTableView):
+    """
+    Custom table view for displaying packages with color coding.
     
     Features:
     - Color-coded rows by package manager
@@ -51,15 +154,15 @@ class PackageTableWidget(QTableWidget):
     
     def setup_table(self):
         """Configure table structure and behavior."""
-        # Set column count and headers
-        self.setColumnCount(4)
-        header_labels = ["Package Name", "Version", "Manager", "Description"]
-        for col, label in enumerate(header_labels):
-            header_item = QTableWidgetItem(label)
-            header_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.horizontalHeaderItem(col) # Ensure item exists
-            self.setHorizontalHeaderItem(col, header_item)
-        
+        # Model (package rows) behind a proxy that handles column sorting
+        self.package_model = PackageTableModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.package_model)
+        # Type-ahead filter: case-insensitive substring match on any column
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy_model.setFilterKeyColumn(-1)
+        self.setModel(self.proxy_model)
+
         # Configure column widths
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
@@ -84,8 +187,8 @@ class PackageTableWidget(QTableWidget):
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
         # Connect signals
-        self.itemDoubleClicked.connect(self._on_double_click)
-        self.itemSelectionChanged.connect(self._on_selection_changed)
+        self.doubleClicked.connect(self._on_double_click)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
         # Enable context menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -101,47 +204,22 @@ class PackageTableWidget(QTableWidget):
         print(f"[PackageTable] set_packages called with {len(packages)} packages")
         self.packages = packages
 
-        # Disable sorting while populating (for performance)
-        self.setSortingEnabled(False)
-        print(f"[PackageTable] Sorting disabled")
-
-        # Clear existing content
-        self.setRowCount(0)
-        self.setRowCount(len(packages))
-        print(f"[PackageTable] Row count set to {len(packages)}")
-
-        # Populate table
-        for row, package in enumerate(packages):
-            if row < 3:  # Debug first 3 packages
-                print(f"[PackageTable] Row {row}: {package.name} v{package.version} ({package.manager.value})")
-
-            # Package name - STORE PACKAGE OBJECT IN USER DATA
-            name_item = QTableWidgetItem(package.name)
-            name_item.setData(Qt.ItemDataRole.UserRole, package)  # Store Package object
-            self.setItem(row, 0, name_item)
-
-            # Version
-            version_item = QTableWidgetItem(package.version)
-            self.setItem(row, 1, version_item)
+        # A new result set is shown unfiltered
+        self.proxy_model.setFilterFixedString("")
 
-            # Manager - show the actual package manager name
-            manager_display = self._format_manager_name(package.manager.value)
-            manager_item = QTableWidgetItem(manager_display)
-            self.setItem(row, 2, manager_item)
+        # A single model reset - the view only requests data for visible rows
+        self.package_model.set_packages(packages)
+        print(f"[PackageTable] Model reset with {len(packages)} rows")
 
-            # Description
-            desc_item = QTableWidgetItem(package.description or "")
-            self.setItem(row, 3, desc_item)
-
-            # Color coding removed - using system theme for better readability
-            # self._apply_row_color(row, package.manager)
+    def set_filter_text(self, text: str):
+        """
+        Filter the displayed rows without reloading the packages.
 
-        print(f"[PackageTable] All {len(packages)} rows populated")
+        Args:
+            text: Substring to match against any column (empty shows all rows)
+        """
+        self.proxy_model.setFilterFixedString(text.strip())
 
-        # Re-enable sorting
-        self.setSortingEnabled(True)
-        print(f"[PackageTable] Sorting re-enabled, table should now display")
-    
     def _format_manager_name(self, manager_value: str) -> str:
         """
         Format package manager name for display.
@@ -152,37 +230,8 @@ class PackageTableWidget(QTableWidget):
         Returns:
             Formatted display name (e.g., "WinGet", "Unknown")
         """
-        # Special formatting for specific managers
-        formatting_map = {
-            'winget': 'WinGet',
-            'chocolatey': 'Chocolatey',
-            'pip': 'Pip',
-            'npm': 'NPM',
-            'cargo': 'Cargo',
-            'scoop': 'Scoop',
-            'msstore': 'MS Store',
-            'unknown': 'Unknown'
-        }
-
-        return formatting_map.get(manager_value, manager_value.capitalize())
-
-    def _apply_row_color(self, row: int, manager: PackageManager):
-        """
-        Apply manager-specific color to row.
+        return MANAGER_DISPLAY_NAMES.get(manager_value, manager_value.capitalize())
 
-        Args:
-            row: Row index
-            manager: Package manager type
-        """
-        color = self.MANAGER_COLORS.get(manager, QColor("#FFFFFF"))
-        text_color = QColor("#000000")  # Black text for readability
-
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            if item:
-                item.setBackground(color)
-                item.setForeground(text_color)
-    
     def get_selected_package(self) -> Optional[Package]:
         """
         Get currently selected package.
@@ -190,26 +239,21 @@ class PackageTableWidget(QTableWidget):
         Returns:
             Selected Package object or None
         """
-        row = self.currentRow()
-        if row < 0:
+        index = self.currentIndex()
+        if not index.isValid():
             return None
 
-        # Get the Package object from the name column's user data
-        # This works correctly even when the table is sorted
-        name_item = self.item(row, 0)
-        if name_item:
-            package = name_item.data(Qt.ItemDataRole.UserRole)
-            return package
-
-        return None
+        # Map the sorted view row back to the model's package list
+        source_index = self.proxy_model.mapToSource(index)
+        return self.package_model.package_at(source_index.row())
     
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, selected=None, deselected=None):
         """Handle selection change event."""
         package = self.get_selected_package()
         if package:
             self.package_selected.emit(package)
     
-    def _on_double_click(self, item):
+    def _on_double_click(self, index):
         """Handle double-click event."""
         package = self.get_selected_package()
         if package:
@@ -223,8 +267,8 @@ class PackageTableWidget(QTableWidget):
             position: Position where the menu was requested
         """
         # Get the package at the clicked position
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
 
         package = self.get_selected_package()
@@ -245,4 +289,4 @@ class PackageTableWidget(QTableWidget):
     def clear_packages(self):
         """Clear all packages from the table."""
         self.packages = []
-        self.setRowCount(0)
+        self.package_model.set_packages([])
@@ -10,31 +10,780 @@ from PyQt6.QtWidgets import (
     QMessageBox, QPushButton, QComboBox, QStatusBar, QApplication,
     QInputDialog, QDialog, QDialogButtonBox, QCheckBox, QTextEdit,
     QMenuBar, QMenu, QLineEdit, QTabWidget, QRadioButton, QButtonGroup,
-    QTextBrowser, QTableWidget, QTableWidgetItem, QHeaderView
+    QTextBrowser, QTableView, QAbstractItemView, QHeaderView, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QTimer, QUrl
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QTimer, QUrl, QThreadPool, QThread
 from PyQt6.QtGui import QFont, QAction, QDesktopServices
-from typing import List, Optional
+from typing import Dict, List, Optional
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from core.models import PackageManager, Package, PackageStatus
 from services.package_service import PackageManagerService
 from services.settings_service import SettingsService
-from ui.workers.package_worker import (
-    PackageListWorker,
-    PackageInstallWorker,
-    PackageUninstallWorker
-)
+from ui.workers.package_worker import PackageOperationWorker
+from ui.workers.install_path_worker import InstallPathWorker
+from ui.workers.version_info_worker import VersionInfoWorker
+from ui.workers.cache_refresh_worker import CacheRefreshWorker
+from ui.workers.installed_packages_worker import InstalledPackagesWorker
+from ui.workers.search_worker import SearchWorker
 from metadata import MetadataCacheService, WinGetProvider, ScoopProvider, ChocolateyProvider, NpmProvider, CargoProvider
 from core.config import config_manager
-from ui.components.package_table import PackageTableWidget
+from ui.components.package_table import PackageTableWidget, MANAGER_DISPLAY_NAMES
+from ui.components.cache_summary import CacheSummaryModel
 from utils.system_utils import WindowsPowerManager
-
-# Markdown rendering imports
-import markdown
-from markdown.extensions import fenced_code, tables, nl2br, sane_lists
-from pygments.formatters import HtmlFormatter
+import heapq
+import itertools
 import os
 import re
+import threading
+import time
+
+try:
+    import winreg
+except ImportError:  # Not on Windows - no registry to search
+    winreg = None
+
+
+# Precompiled patterns for install location discovery
+_VERSION_ONLY_RE = re.compile(r'^\d+(\.\d+)*$')
+_DIGITS_RE = re.compile(r'^\d+$')
+_TRAILING_VERSION_RE = re.compile(r'\s+\d+(\.\d+)*$')
+_EXE_PATH_RE = re.compile(r'^"?([A-Z]:[^"]+?)\\[^\\]+\.exe', re.IGNORECASE)
+_VERSION_SUBDIR_RE = re.compile(r'(^|[^a-z])(v?\d+\.?\d*|bin|app|x64|x86|win\d+)$')
+
+# `winget show` labels that precede the installation directory (lowercase)
+_WINGET_LOCATION_KEYS = ('install location:', 'installation folder:')
+
+# Repository root (ui/views/main_window.py -> ../..) and the docs read from it
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_CHANGELOG_PATH = os.path.join(_REPO_ROOT, "CHANGELOG.md")
+_USER_GUIDE_PATH = os.path.join(_REPO_ROOT, 'docs', 'user-guide.md')
+_SHORTCUTS_PATH = os.path.join(_REPO_ROOT, 'docs', 'keyboard-shortcuts.md')
+
+# First CHANGELOG.md release header: ## [0.3.0] - 2025-12-26 21:20
+_VERSION_HEADER_RE = re.compile(r'##\s+\[([^\]]+)\]\s+-\s+(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2})?)')
+
+# Name normalization in one pass: fold ASCII upper case and drop whitespace,
+# hyphens and underscores
+_NORMALIZE_TABLE = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz', ' \t\n\r\f\v\xa0-_'
+)
+
+# Uninstall registry locations searched for install paths: (hkey, path, hive)
+_ALL_REGISTRY_PATHS = (
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "HKLM"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall", "HKLM"),
+    (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "HKCU"),
+) if winreg else ()
+
+# Search orders: default, and with the ARP-indicated hive first (others as fallback)
+_PATHS_DEFAULT = tuple((hkey, path) for hkey, path, _ in _ALL_REGISTRY_PATHS)
+_PATHS_HKLM_FIRST = tuple(
+    (hkey, path) for hkey, path, hive in sorted(_ALL_REGISTRY_PATHS, key=lambda p: p[2] != "HKLM")
+)
+_PATHS_HKCU_FIRST = tuple(
+    (hkey, path) for hkey, path, hive in sorted(_ALL_REGISTRY_PATHS, key=lambda p: p[2] != "HKCU")
+)
+
+# Window stylesheets for apply_theme
+_DARK_QSS = """
+QMainWindow {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+QWidget {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+QPushButton {
+    background-color: #0078d4;
+    color: #ffffff;
+    border: none;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #1984d8;
+}
+QPushButton:disabled {
+    background-color: #2d2d2d;
+    color: #666666;
+}
+QComboBox {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    border: 1px solid #3d3d3d;
+    padding: 4px;
+}
+QLabel {
+    color: #ffffff;
+}
+QStatusBar {
+    background-color: #2d2d2d;
+    color: #ffffff;
+}
+"""
+
+_LIGHT_QSS = """
+QPushButton {
+    background-color: #0078d4;
+    color: #ffffff;
+    border: none;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #1984d8;
+}
+QPushButton:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+"""
+
+# How long closing the window blocks waiting for background threads
+_CLOSE_WAIT_SECONDS = 2.0
+
+
+@lru_cache(maxsize=1)
+def _read_changelog_version() -> tuple:
+    """
+    Read the newest version and release date from CHANGELOG.md.
+
+    The file does not change while the app runs, so it is read once per
+    process.
+
+    Returns:
+        (version, date_time) tuple, "Unknown" for any part not found
+    """
+    version = "Unknown"
+    date_time = "Unknown"
+
+    if os.path.exists(_CHANGELOG_PATH):
+        try:
+            with open(_CHANGELOG_PATH, 'r', encoding='utf-8') as f:
+                # Newest entry is at the top - stop at the first version line
+                for line in f:
+                    # Look for first version line: ## [0.3.0] - 2025-12-26 21:20
+                    match = _VERSION_HEADER_RE.match(line)
+                    if match:
+                        version = match.group(1)
+                        date_time = match.group(2)
+                        break
+        except Exception:
+            pass
+
+    return version, date_time
+
+
+@lru_cache(maxsize=1)
+def _get_markdown():
+    """
+    Build the shared Markdown converter for the help dialogs.
+
+    markdown is imported here rather than at module load, so startup does
+    not pay for it unless a help dialog is opened.
+    """
+    import markdown
+
+    # Configure markdown extensions (GitHub-flavored)
+    extensions = [
+        'fenced_code',      # ```code blocks```
+        'tables',           # GitHub markdown tables
+        'nl2br',            # Convert newlines to <br>
+        'sane_lists',       # Better list handling
+        'codehilite',       # Syntax highlighting
+        'toc',              # Table of contents support
+    ]
+
+    # Configure extension settings
+    extension_configs = {
+        'codehilite': {
+            'css_class': 'highlight',
+            'linenums': False,
+            'guess_lang': True
+        }
+    }
+
+    return markdown.Markdown(
+        extensions=extensions,
+        extension_configs=extension_configs
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_text_file_cached(path: str, mtime: float) -> str:
+    """Read a UTF-8 text file; keyed on mtime so edits are picked up."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def _read_help_file(path: str) -> str:
+    """Read a help document, reusing the cached contents while it is unchanged."""
+    return _read_text_file_cached(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=2)
+def _get_pygments_css(style: str) -> str:
+    """Get the Pygments CSS for a highlight style (imported on first use)."""
+    from pygments.formatters import HtmlFormatter
+    return HtmlFormatter(style=style).get_style_defs('.highlight')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize name by removing spaces, hyphens, and lowercasing."""
+    normalized = name.translate(_NORMALIZE_TABLE)
+    # Only non-ASCII names need the full Unicode lower() pass
+    return normalized if normalized.isascii() else normalized.lower()
+
+
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz')
+
+
+def _contains_word(haystack: str, needle: str) -> bool:
+    """Check whether needle occurs in haystack with no a-z letter on either side."""
+    find = haystack.find  # bound once - called per occurrence
+    end_offset = len(needle)
+    haystack_len = len(haystack)
+    index = find(needle)
+    while index != -1:
+        end = index + end_offset
+        if ((index == 0 or haystack[index - 1] not in _WORD_CHARS) and
+                (end == haystack_len or haystack[end] not in _WORD_CHARS)):
+            return True
+        index = find(needle, index + 1)
+    return False
+
+
+def _read_registry_values(app_key) -> dict:
+    """Read all values of a registry key in one enumeration pass."""
+    values = {}
+    for i in range(winreg.QueryInfoKey(app_key)[1]):
+        try:
+            name, value, _ = winreg.EnumValue(app_key, i)
+        except OSError:
+            break
+        values[name] = value
+    return values
+
+
+def _scan_uninstall_key(hkey, registry_path: str) -> tuple:
+    """
+    Read every entry with a DisplayName under one Uninstall key.
+
+    Returns:
+        Tuple of (subkey_name, subkey_normalized, display_name, display_normalized, values)
+    """
+    entries = []
+    try:
+        with winreg.OpenKey(hkey, registry_path) as reg_key:
+            # Enumerate subkey names up front, then open each entry
+            subkey_names = []
+            for i in range(winreg.QueryInfoKey(reg_key)[0]):
+                try:
+                    subkey_names.append(winreg.EnumKey(reg_key, i))
+                except OSError:
+                    break
+
+            for subkey_name in subkey_names:
+                try:
+                    with winreg.OpenKey(reg_key, subkey_name) as app_key:
+                        values = _read_registry_values(app_key)
+                except OSError:
+                    continue
+
+                display_name = values.get("DisplayName")
+                if not display_name:
+                    continue
+
+                entries.append((
+                    subkey_name, _normalize_name(subkey_name),
+                    display_name, _normalize_name(display_name),
+                    values
+                ))
+    except FileNotFoundError:
+        pass
+    return tuple(entries)
+
+
+def _scan_uninstall_registry() -> dict:
+    """
+    Read all Uninstall keys, one thread per key (winreg releases the GIL).
+
+    Returns:
+        Dict mapping (hkey, registry_path) to _scan_uninstall_key() entries
+    """
+    with ThreadPoolExecutor(max_workers=len(_PATHS_DEFAULT) or 1) as executor:
+        results = executor.map(lambda key: _scan_uninstall_key(*key), _PATHS_DEFAULT)
+        return dict(zip(_PATHS_DEFAULT, results))
+
+
+# Uninstall registry snapshot shared by install location lookups (pool threads)
+_UNINSTALL_SNAPSHOT_TTL = 30.0  # seconds
+_uninstall_snapshot: Optional[dict] = None
+_uninstall_snapshot_time = 0.0
+_uninstall_snapshot_lock = threading.Lock()
+
+
+def _get_uninstall_snapshot() -> dict:
+    """Return the Uninstall registry snapshot, rescanning once it is older than the TTL."""
+    global _uninstall_snapshot, _uninstall_snapshot_time
+    with _uninstall_snapshot_lock:
+        if (_uninstall_snapshot is None or
+                time.monotonic() - _uninstall_snapshot_time > _UNINSTALL_SNAPSHOT_TTL):
+            _uninstall_snapshot = _scan_uninstall_registry()
+            _uninstall_snapshot_time = time.monotonic()
+        return _uninstall_snapshot
+
+
+def _clear_install_location_caches():
+    """Drop memoized install locations after installed software changes."""
+    global _uninstall_snapshot
+    with _uninstall_snapshot_lock:
+        _uninstall_snapshot = None
+    _resolve_install_path.cache_clear()
+    _is_dir.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _is_dir(path: str) -> bool:
+    """Memoized os.path.isdir for the install directories probed during registry scans."""
+    return os.path.isdir(path)
+
+
+@lru_cache(maxsize=256)
+def _resolve_install_path(package_id: str) -> Optional[str]:
+    """
+    Get installation location for a WinGet package.
+
+    Strategy:
+    1. Try Windows Registry (for traditionally installed apps)
+    2. If not found, query WinGet directly (for WinGet-managed apps)
+
+    Uses very strict matching to avoid false positives. Better to show no path
+    than the wrong path.
+
+    Results are memoized per package ID for the session, and the registry
+    is read from a shared snapshot; call _clear_install_location_caches()
+    after installs/uninstalls.
+    """
+    import subprocess
+
+    if winreg is None:
+        return None
+
+    def iter_search_terms(package_id: str, actual_package_id: str):
+        """Yield (term, term_type, base_confidence) search terms in priority order."""
+        package_parts = actual_package_id.split('.')
+
+        # For ARP packages, the package ID IS the subkey name - prioritize exact match
+        if package_id.startswith("ARP\\"):
+            # Try exact subkey match first with highest confidence
+            yield (actual_package_id, "arp_subkey", 120)  # Exact match (not normalized)
+            yield (_normalize_name(actual_package_id), "arp_normalized", 100)
+
+            # Also try just the base name without version numbers
+            # "Vim 9.1" -> "Vim"
+            base_name = _TRAILING_VERSION_RE.sub('', actual_package_id).strip()
+            if base_name and base_name != actual_package_id:
+                print(f"[InstallPath] ARP base name: {base_name}")
+                yield (_normalize_name(base_name), "arp_base", 90)
+
+        elif len(package_parts) > 1:
+            # For "CPUID.HWMonitor", try: full ID, last part, first part
+            yield (_normalize_name(actual_package_id), "full_id", 100)  # Base confidence for full ID
+
+            # Only add parts that aren't just version numbers
+            last_part = package_parts[-1]
+            first_part = package_parts[0]
+
+            if not _DIGITS_RE.match(last_part) and len(last_part) > 2:
+                yield (_normalize_name(last_part), "product", 80)  # Product name
+
+            if not _DIGITS_RE.match(first_part) and len(first_part) > 2:
+                yield (_normalize_name(first_part), "publisher", 70)  # Publisher name
+
+        else:
+            # Single-part ID (if it's not a version number)
+            if len(actual_package_id) > 2:
+                yield (_normalize_name(actual_package_id), "full_id", 100)
+
+    def get_install_path(values: dict):
+        """Try to extract install location from registry key values using multiple methods."""
+        # Method 1: InstallLocation field
+        install_location = values.get("InstallLocation")
+        if install_location and install_location.strip() and _is_dir(install_location.strip()):
+            return install_location.strip()
+
+        # Method 2: InstallPath field
+        install_path = values.get("InstallPath")
+        if install_path and install_path.strip() and _is_dir(install_path.strip()):
+            return install_path.strip()
+
+        # Method 3: Extract from UninstallString (often contains path to uninstaller)
+        uninstall_string = values.get("UninstallString")
+        if uninstall_string:
+            # Extract directory from uninstall path
+            # e.g., "C:\Program Files\Vim\vim91\uninstall.exe" -> "C:\Program Files\Vim"
+            match = _EXE_PATH_RE.search(uninstall_string)
+            if match:
+                path = match.group(1)
+
+                # Decide whether to use path or parent directory
+                # Check if path looks like a versioned subdirectory (e.g., "vim91", "v1.2.3")
+                path_basename = os.path.basename(path).lower()
+
+                # Patterns that indicate a versioned subdirectory
+                is_version_subdir = (
+                    _VERSION_SUBDIR_RE.search(path_basename) or
+                    'uninstall' in path_basename
+                )
+
+                if is_version_subdir:
+                    # Use parent directory for versioned subdirs (e.g., vim91 -> Vim)
+                    parent = os.path.dirname(path)
+                    if parent and _is_dir(parent):
+                        return parent
+
+                # Use the extracted path itself
+                if path and _is_dir(path):
+                    return path
+
+        # Method 4: Extract from InstallString
+        install_string = values.get("InstallString")
+        if install_string:
+            match = _EXE_PATH_RE.search(install_string)
+            if match:
+                path = match.group(1)
+                path_basename = os.path.basename(path).lower()
+
+                # Check if path looks like a versioned subdirectory
+                is_version_subdir = (
+                    _VERSION_SUBDIR_RE.search(path_basename) or
+                    'uninstall' in path_basename or
+                    'install' in path_basename
+                )
+
+                if is_version_subdir:
+                    parent = os.path.dirname(path)
+                    if parent and _is_dir(parent):
+                        return parent
+
+                if path and _is_dir(path):
+                    return path
+
+        return None
+
+    try:
+        print(f"[InstallPath] Looking for: {package_id}")
+
+        # Skip package IDs that are just version numbers (e.g., "4.7.1", "1.2.3")
+        # These won't match anything meaningful in the registry
+        if _VERSION_ONLY_RE.match(package_id):
+            print(f"[InstallPath] Skipping version-only package ID")
+            return None
+
+        # Handle ARP (Add/Remove Programs) registry paths from WinGet
+        # Format: ARP\Machine\X64\PackageName or ARP\User\X64\PackageName
+        actual_package_id = package_id
+        target_hive = None  # None means search all hives
+
+        if package_id.startswith("ARP\\"):
+            parts = package_id.split("\\")
+            if len(parts) >= 4:
+                # Extract: ARP\Machine\X64\Vim 9.1 -> "Vim 9.1"
+                actual_package_id = "\\".join(parts[3:])
+
+                # Determine which registry hive to search
+                if parts[1].lower() == "machine":
+                    target_hive = "HKLM"
+                elif parts[1].lower() == "user":
+                    target_hive = "HKCU"
+
+                print(f"[InstallPath] Detected ARP format, extracted: {actual_package_id} (hive: {target_hive or 'all'})")
+
+        # For ARP packages, search the indicated hive first, then fall back to all hives
+        # (WinGet's ARP path might not always be accurate)
+        if target_hive == "HKLM":
+            registry_paths = _PATHS_HKLM_FIRST
+        elif target_hive == "HKCU":
+            registry_paths = _PATHS_HKCU_FIRST
+        else:
+            registry_paths = _PATHS_DEFAULT
+        if target_hive:
+            print(f"[InstallPath] Will search {target_hive} first, then other hives")
+
+        # For ARP packages the subkey name is known - open it directly before
+        # falling back to enumerating the whole Uninstall tree
+        if package_id.startswith("ARP\\"):
+            for hkey, registry_path in registry_paths:
+                try:
+                    with winreg.OpenKey(hkey, f"{registry_path}\\{actual_package_id}") as app_key:
+                        install_path = get_install_path(_read_registry_values(app_key))
+                except OSError:
+                    continue
+                if install_path:
+                    print(f"[InstallPath] [OK] Direct ARP subkey hit: {registry_path}\\{actual_package_id}")
+                    return install_path
+
+        # Highest confidence a term can reach (its best bonus is an exact subkey match)
+        def term_ceiling(term):
+            _, term_type, base_confidence = term
+            return base_confidence + (30 if term_type == "arp_subkey" else 20)
+
+        # Search terms ordered by reachable confidence (stable, so ties keep priority
+        # order); reused for every registry entry below. Once an entry scores at least
+        # the next term's ceiling, the remaining terms can't beat it.
+        search_terms = tuple(sorted(iter_search_terms(package_id, actual_package_id),
+                                    key=term_ceiling, reverse=True))
+        term_ceilings = tuple(term_ceiling(term) for term in search_terms)
+
+        # Terms long enough to earn the install path boost
+        path_boost_terms = tuple(term for term, _, _ in search_terms if len(term) > 3)
+
+        # If we ended up with no search terms, bail out
+        if not search_terms:
+            print(f"[InstallPath] No valid search terms could be generated")
+            return None
+
+        # Cheap pre-check before scoring: arp_subkey terms only match on
+        # case-insensitive equality (a set lookup), every other term only
+        # matches when it occurs in one of the normalized fields
+        arp_exact_terms = frozenset(term.lower() for term, term_type, _ in search_terms
+                                    if term_type == "arp_subkey")
+        substring_terms = tuple(term for term, term_type, _ in search_terms
+                                if term_type != "arp_subkey")
+
+        # Best score any entry can reach (top term ceiling plus the path boost).
+        # Ties keep scan order, so the first entry to reach it is the final answer.
+        max_confidence = term_ceilings[0] + 5
+
+        print(f"[InstallPath] Search terms: {[term for term, _, _ in search_terms]}")
+
+        # Keep only the five best candidates (min-heap keyed by confidence, then scan order)
+        top_candidates = []
+        candidate_count = 0
+        registry_entries_matched = 0  # Scored high enough and have an install path
+
+        snapshot = _get_uninstall_snapshot()
+        scanned_entries = [snapshot.get(registry_key, ()) for registry_key in registry_paths]
+        registry_entries_total = sum(len(entries) for entries in scanned_entries)  # All entries with a DisplayName
+
+        for entries in scanned_entries:
+            for subkey_name, subkey_normalized, display_name, display_normalized, values in entries:
+                # Most entries match no term at all - skip them without scoring
+                for term in substring_terms:
+                    if term in subkey_normalized or term in display_normalized:
+                        break
+                else:
+                    if not arp_exact_terms or (subkey_name.lower() not in arp_exact_terms and
+                                               display_name.lower() not in arp_exact_terms):
+                        continue
+
+                # Try each search term and use the highest confidence match
+                best_confidence = 0
+                match_reason = ""
+
+                for term_index, (search_term, term_type, base_confidence) in enumerate(search_terms):
+                    if best_confidence >= term_ceilings[term_index]:
+                        break  # Remaining terms can't beat this match
+
+                    confidence = 0
+
+                    # For ARP packages, check both subkey AND display name
+                    if term_type in ["arp_subkey", "arp_normalized", "arp_base"]:
+                        # Try exact subkey match (case-sensitive for arp_subkey)
+                        if term_type == "arp_subkey":
+                            if search_term == subkey_name:
+                                confidence = base_confidence + 30
+                                match_reason = f"subkey_exact_arp"
+                            elif search_term.lower() == subkey_name.lower():
+                                confidence = base_confidence + 20
+                                match_reason = f"subkey_exact_arp_ci"
+                            # Also check display name for ARP exact match
+                            elif search_term == display_name:
+                                confidence = base_confidence + 25
+                                match_reason = f"display_exact_arp"
+                            elif search_term.lower() == display_name.lower():
+                                confidence = base_confidence + 15
+                                match_reason = f"display_exact_arp_ci"
+                        else:
+                            # For normalized/base ARP terms, check normalized fields
+                            if search_term == subkey_normalized:
+                                confidence = base_confidence + 20
+                                match_reason = f"subkey_exact_{term_type}"
+                            elif search_term == display_normalized:
+                                confidence = base_confidence + 15
+                                match_reason = f"display_exact_{term_type}"
+                            elif display_normalized.startswith(search_term) and len(search_term) > 3:
+                                confidence = base_confidence + 5
+                                match_reason = f"display_starts_{term_type}"
+                            elif search_term in subkey_normalized and len(search_term) > 3:
+                                confidence = base_confidence
+                                match_reason = f"subkey_contains_{term_type}"
+
+                    # Check registry subkey name (normalized) for non-ARP
+                    elif search_term == subkey_normalized:
+                        confidence = base_confidence + 20
+                        match_reason = f"subkey_exact_{term_type}"
+                    elif search_term in subkey_normalized and len(search_term) > 3:
+                        confidence = base_confidence + 10
+                        match_reason = f"subkey_contains_{term_type}"
+                    # Check display name for non-ARP
+                    elif display_normalized == search_term:
+                        confidence = base_confidence
+                        match_reason = f"display_exact_{term_type}"
+                    elif display_normalized.startswith(search_term):
+                        confidence = base_confidence - 10
+                        match_reason = f"display_starts_{term_type}"
+                    elif search_term in display_normalized and len(search_term) > 3:
+                        # Only match if it's a whole word (surrounded by non-letters)
+                        if _contains_word(display_normalized, search_term):
+                            confidence = base_confidence - 20
+                            match_reason = f"display_word_{term_type}"
+
+                    # Update best confidence
+                    if confidence > best_confidence:
+                        best_confidence = confidence
+                        match_reason = match_reason
+
+                # Even with the +5 path boost this entry can't reach the 60 floor,
+                # so skip resolving its install path (filesystem probes)
+                if best_confidence < 55:
+                    continue
+
+                install_path = get_install_path(values)
+                if not install_path:
+                    continue
+
+                registry_entries_matched += 1
+
+                # Boost if install path contains any search term
+                install_path_lower = install_path.lower()
+                if any(term in install_path_lower for term in path_boost_terms):
+                    best_confidence += 5
+
+                if best_confidence >= max_confidence and best_confidence >= 70:
+                    print(f"[InstallPath] [OK] Returning best possible match: {display_name} "
+                          f"({match_reason}, Subkey: {subkey_name})")
+                    return install_path
+
+                # Only add if we have a reasonable match
+                if best_confidence >= 60:
+                    candidate_count += 1
+                    entry = (best_confidence, -candidate_count,
+                             (best_confidence, display_name, install_path, match_reason, subkey_name))
+                    if len(top_candidates) < 5:
+                        heapq.heappush(top_candidates, entry)
+                    else:
+                        heapq.heappushpop(top_candidates, entry)
+
+        # Debug output
+        print(f"[InstallPath] Scanned {registry_entries_total} entries ({registry_entries_matched} matching with install paths)")
+        if not candidate_count and registry_entries_total > 0:
+            # Built only on this miss path, so successful lookups skip the formatting
+            print(f"[InstallPath] Sample of ALL registry entries ([+]=has path, [-]=no path):")
+            sample = itertools.islice(itertools.chain.from_iterable(scanned_entries), 20)
+            for subkey_name, _, display_name, _, values in sample:
+                has_path = "[+]" if get_install_path(values) else "[-]"
+                print(f"  {has_path} {display_name} (subkey: {subkey_name})")
+
+        # Highest confidence first; ties keep scan order
+        candidates = [candidate for _, _, candidate in sorted(top_candidates, reverse=True)]
+
+        if candidates:
+            print(f"[InstallPath] Found {candidate_count} candidates:")
+            for conf, name, path, reason, subkey in candidates:  # Show top 5
+                print(f"  [{conf}] {name}")
+                print(f"       Reason: {reason}, Subkey: {subkey}")
+                print(f"       Path: {path}")
+
+            # Only return if confidence is high enough (>= 70 to be more strict)
+            if candidates[0][0] >= 70:
+                print(f"[InstallPath] [OK] Returning best match: {candidates[0][1]}")
+                return candidates[0][2]
+            else:
+                print(f"[InstallPath] [SKIP] Best match confidence too low ({candidates[0][0]}), returning None")
+        else:
+            print(f"[InstallPath] No candidates found in registry")
+
+        # Fallback: Query WinGet directly for installation location
+        # NOTE: Only works for WinGet-managed packages (not ARP entries)
+        if not package_id.startswith("ARP\\"):
+            print(f"[InstallPath] Trying winget show as fallback...")
+            try:
+                # Stream the output so we can stop at the first install location line
+                process = subprocess.Popen(
+                    ['winget', 'show', '--id', package_id, '--accept-source-agreements'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding='utf-8',
+                    errors='ignore'
+                )
+
+                # Reading stdout has no timeout of its own - kill winget if it hangs
+                killed = threading.Event()
+
+                def kill_winget():
+                    killed.set()
+                    process.kill()
+
+                watchdog = threading.Timer(10, kill_winget)
+                watchdog.start()
+                found_path = None
+                try:
+                    # Parse output for "Install Location:" or "Installation Folder:"
+                    for line in process.stdout:
+                        line_lower = line.lower()
+                        if any(key in line_lower for key in _WINGET_LOCATION_KEYS):
+                            # Extract path after the colon
+                            parts = line.split(':', 1)
+                            if len(parts) == 2:
+                                install_path = parts[1].strip()
+                                if install_path and _is_dir(install_path):
+                                    found_path = install_path
+                                    break
+                                else:
+                                    print(f"[InstallPath] Path from winget doesn't exist: {install_path}")
+                except BaseException:
+                    process.kill()
+                    raise
+                finally:
+                    # Only stop winget early once we have what we need; at EOF let
+                    # it exit on its own, still bounded by the watchdog
+                    if found_path and process.poll() is None:
+                        process.terminate()
+                    process.stdout.close()
+                    process.wait()
+                    watchdog.cancel()
+
+                # Output cut short by the watchdog can't be trusted; stopping
+                # winget ourselves after a match is expected
+                if killed.is_set():
+                    print(f"[InstallPath] winget show timed out")
+                elif found_path:
+                    print(f"[InstallPath] [OK] Found via winget show: {found_path}")
+                    return found_path
+                elif process.returncode != 0:
+                    print(f"[InstallPath] winget show failed (exit code {process.returncode})")
+                else:
+                    print(f"[InstallPath] winget show returned no install location")
+
+            except Exception as e:
+                print(f"[InstallPath] winget show error: {e}")
+        else:
+            print(f"[InstallPath] ARP packages don't support winget show, skipping fallback")
+
+        return None
+
+    except Exception as e:
+        print(f"[InstallPath] ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
 
 
 class WinPacManMainWindow(QMainWindow):
@@ -48,6 +797,13 @@ class WinPacManMainWindow(QMainWindow):
     - Color-coded package display
     """
 
+    # Re-emitted install location results (package_id, path or None)
+    install_path_resolved = pyqtSignal(str, object)
+
+    # Package operations dispatched to the persistent worker thread (manager, package_id)
+    _request_install = pyqtSignal(object, str)
+    _request_uninstall = pyqtSignal(object, str)
+
     def __init__(self):
         super().__init__()
 
@@ -55,55 +811,120 @@ class WinPacManMainWindow(QMainWindow):
         self.package_service = PackageManagerService()
         self.settings_service = SettingsService()
 
-        # Initialize metadata cache
-        cache_db_path = config_manager.get_data_file_path("metadata_cache.db")
-        self.metadata_cache = MetadataCacheService(cache_db_path)
-
-        # Register WinGet provider
-        winget_provider = WinGetProvider()
-        self.metadata_cache.register_provider(winget_provider)
-
-        # Register Chocolatey provider
-        chocolatey_provider = ChocolateyProvider()
-        self.metadata_cache.register_provider(chocolatey_provider)
-
-        # Register Scoop provider
-        scoop_provider = ScoopProvider()
-        self.metadata_cache.register_provider(scoop_provider)
-
-        # Register NPM provider
-        npm_provider = NpmProvider()
-        self.metadata_cache.register_provider(npm_provider)
-
-        # Register Cargo provider
-        cargo_provider = CargoProvider()
-        self.metadata_cache.register_provider(cargo_provider)
+        # Metadata cache is opened on first use (see metadata_cache property)
 
         # State
         self.current_packages: List[Package] = []
         self.operation_in_progress = False
-        self.current_worker: Optional[PackageListWorker] = None
-        self.current_install_worker: Optional[PackageInstallWorker] = None
-        self.current_uninstall_worker: Optional[PackageUninstallWorker] = None
+        self.current_worker: Optional[QThread] = None  # InstalledPackagesWorker
+        self.pending_operation: Optional[str] = None  # 'install' or 'uninstall' while queued/running
+        self.pending_operation_message = ""
         self.selected_package: Optional[Package] = None
         self.verbose_mode = False  # Show detailed package manager output
         self.table_mode = None  # 'installed' or 'available' - tracks what's currently in the table
 
-        # Animated spinner for progress indication
-        self.spinner_frames = ["⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"]
-        self.spinner_index = 0
-        self.spinner_timer = QTimer()
-        self.spinner_timer.timeout.connect(self._update_spinner)
+        # Install location lookups in flight (resolved off the GUI thread)
+        self._install_path_workers: Dict[str, InstallPathWorker] = {}
+
+        # Selection-driven prefetch waits for the selection to settle, so
+        # arrowing through the table does not queue a lookup per row
+        self._pending_install_path_id: Optional[str] = None
+        self._install_path_prefetch = QTimer(self)
+        self._install_path_prefetch.setSingleShot(True)
+        self._install_path_prefetch.setInterval(200)
+        self._install_path_prefetch.timeout.connect(self._prefetch_install_path)
+
+        # Metadata cache refresh running in the background (at most one)
+        self._cache_refresh_worker: Optional[CacheRefreshWorker] = None
+        self._cache_refresh_errors: List[str] = []
+        self._cache_refresh_pending = 0
+        self._search_after_cache_refresh = False
+
+        # Search requests (Enter, button, context menu) are coalesced so a
+        # burst of triggers runs a single query
+        self._search_request_timer = QTimer(self)
+        self._search_request_timer.setSingleShot(True)
+        self._search_request_timer.setInterval(200)
+        self._search_request_timer.timeout.connect(self._do_search_now)
+
+        # Cache searches in flight (older ones are cancelled, kept until finished)
+        self._search_workers: List[SearchWorker] = []
+        self._active_search_query = ""
+
+        # Non-modal error boxes kept alive until dismissed
+        self._error_boxes: List[QMessageBox] = []
+
+        # Current progress message (shown next to the busy indicator)
         self.progress_message = ""
 
+        # Set once the window has started shutting down its workers
+        self._closing = False
+
+        # Rendered help documents keyed by (markdown text, dark theme)
+        self._md_html_cache: Dict[tuple, str] = {}
+
+        # Search box state is applied once typing pauses
+        self._pending_search_text = ""
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self._apply_search_state)
+
         # Persistent status message (shows package count)
         self.persistent_status = "Ready"
 
+        # System clipboard (application-wide singleton)
+        self._clipboard = QApplication.clipboard()
+
         # Setup
         self.init_window()
         self.init_ui()
         self.apply_theme()
 
+        # One long-lived thread runs all install/uninstall operations
+        self._worker_thread = QThread(self)
+        self._package_worker = PackageOperationWorker(self.package_service)
+        self._package_worker.moveToThread(self._worker_thread)
+        self._request_install.connect(self._package_worker.install)
+        self._request_uninstall.connect(self._package_worker.uninstall)
+        self._package_worker.signals.started.connect(self._on_package_operation_started)
+        self._package_worker.signals.progress.connect(self.on_progress_update)
+        self._package_worker.signals.operation_complete.connect(self._on_package_operation_complete)
+        self._package_worker.signals.error_occurred.connect(self.on_error)
+        self._package_worker.signals.finished.connect(self.on_operation_finished)
+        self._worker_thread.start()
+
+        # Menu bar and version label are not needed for first paint
+        QTimer.singleShot(0, self._init_ui_deferred)
+
+    @cached_property
+    def metadata_cache(self) -> MetadataCacheService:
+        """
+        Metadata cache service, created on first access.
+
+        Opening (and migrating) the SQLite cache is deferred until something
+        needs it, so the window can paint before the database is touched.
+        """
+        cache_db_path = config_manager.get_data_file_path("metadata_cache.db")
+        metadata_cache = MetadataCacheService(cache_db_path)
+
+        # Register WinGet provider
+        metadata_cache.register_provider(WinGetProvider())
+
+        # Register Chocolatey provider
+        metadata_cache.register_provider(ChocolateyProvider())
+
+        # Register Scoop provider
+        metadata_cache.register_provider(ScoopProvider())
+
+        # Register NPM provider
+        metadata_cache.register_provider(NpmProvider())
+
+        # Register Cargo provider
+        metadata_cache.register_provider(CargoProvider())
+
+        return metadata_cache
+
     def init_window(self):
         """Initialize window properties."""
         self.setWindowTitle("WinPacMan - Windows Package Manager")
@@ -112,10 +933,7 @@ class WinPacManMainWindow(QMainWindow):
         self.restore_window_geometry()
 
     def init_ui(self):
-        """Setup user interface."""
-        # Create menu bar
-        self.create_menu_bar()
-
+        """Setup user interface needed for the first paint."""
         # Create main widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -128,9 +946,8 @@ class WinPacManMainWindow(QMainWindow):
         header_layout = QHBoxLayout()
         header_layout.addStretch()  # Push version label to the right
 
-        # Version label
-        version_info = self._get_version_info()
-        self.version_label = QLabel(version_info)
+        # Version label (filled in by _init_ui_deferred)
+        self.version_label = QLabel("")
         self.version_label.setStyleSheet("color: #666666; font-size: 9pt; padding-bottom: 5px;")
         header_layout.addWidget(self.version_label)
 
@@ -157,15 +974,34 @@ class WinPacManMainWindow(QMainWindow):
         main_layout.setSpacing(5)  # Reduce spacing between control panel and table
 
         # Single large package table (shared by both functions)
+        # UniqueConnection guards against duplicate wiring if the UI is rebuilt
         self.package_table = PackageTableWidget()
-        self.package_table.package_double_clicked.connect(self.on_package_details)
-        self.package_table.package_selected.connect(self.on_package_selected)
-        self.package_table.search_in_available_requested.connect(self.on_search_in_available_requested)
+        self.package_table.package_double_clicked.connect(
+            self.on_package_details, Qt.ConnectionType.UniqueConnection
+        )
+        self.package_table.package_selected.connect(
+            self.on_package_selected, Qt.ConnectionType.UniqueConnection
+        )
+        self.package_table.search_in_available_requested.connect(
+            self.on_search_in_available_requested, Qt.ConnectionType.UniqueConnection
+        )
         main_layout.addWidget(self.package_table)
 
         # Status bar at bottom
         self.create_status_bar()
 
+    def _init_ui_deferred(self):
+        """Build non-critical UI once the event loop is running."""
+        self.create_menu_bar()
+
+        # Update tab labels with package counts (first metadata cache access)
+        self.update_tab_counts()
+
+        # Read CHANGELOG.md for the version label off the GUI thread
+        self._version_worker = VersionInfoWorker(self._get_version_info)
+        self._version_worker.signals.version_info_ready.connect(self.version_label.setText)
+        QThreadPool.globalInstance().start(self._version_worker)
+
     def create_installed_controls(self) -> QVBoxLayout:
         """Create left side controls for Installed packages."""
         layout = QVBoxLayout()
@@ -234,6 +1070,16 @@ class WinPacManMainWindow(QMainWindow):
         self.install_btn.setEnabled(False)  # Disabled until data appears
         layout.addWidget(self.install_btn)
 
+        # Busy indicator - an indeterminate progress bar that Qt animates
+        # itself, so no Python code runs per animation frame
+        self.busy_indicator = QProgressBar()
+        self.busy_indicator.setRange(0, 0)
+        self.busy_indicator.setTextVisible(False)
+        self.busy_indicator.setFixedWidth(80)
+        self.busy_indicator.setMaximumHeight(12)
+        self.busy_indicator.setVisible(False)
+        layout.addWidget(self.busy_indicator)
+
         # Progress label (shows loading status)
         self.progress_label = QLabel("")
         self.progress_label.setVisible(False)
@@ -257,9 +1103,11 @@ class WinPacManMainWindow(QMainWindow):
             # 'Pip': ['pip'],  # Future
             # 'NPM': ['npm'],  # Future
         }
+        # Tab names by index (tab order never changes after creation)
+        self._tab_name_order = tuple(self.tab_managers.keys())
 
         # Create tabs
-        for tab_name in self.tab_managers.keys():
+        for tab_name in self._tab_name_order:
             # Create empty widget for each tab (we use one shared package table)
             tab_widget = QWidget()
             self.repo_tabs.addTab(tab_widget, tab_name)
@@ -270,33 +1118,25 @@ class WinPacManMainWindow(QMainWindow):
         # Set default tab to "All Packages"
         self.repo_tabs.setCurrentIndex(0)
 
-        # Update tab labels with package counts
-        self.update_tab_counts()
+        # Tab labels get their package counts in _init_ui_deferred()
 
     def update_tab_counts(self):
         """Update tab labels with package counts from cache."""
         try:
-            # Get counts for each manager
-            winget_count = self.metadata_cache.get_package_count('winget')
-            choco_count = self.metadata_cache.get_package_count('chocolatey')
-            scoop_count = self.metadata_cache.get_package_count('scoop')
-            total_count = winget_count + choco_count + scoop_count
-
-            # Update tab labels
-            for i in range(self.repo_tabs.count()):
-                tab_name = list(self.tab_managers.keys())[i]
-                if tab_name == 'All Packages':
-                    label = f"All Packages ({total_count:,})" if total_count > 0 else "All Packages"
-                elif tab_name == 'WinGet':
-                    label = f"WinGet ({winget_count:,})" if winget_count > 0 else "WinGet"
-                elif tab_name == 'Chocolatey':
-                    label = f"Chocolatey ({choco_count:,})" if choco_count > 0 else "Chocolatey"
-                elif tab_name == 'Scoop':
-                    label = f"Scoop ({scoop_count:,})" if scoop_count > 0 else "Scoop"
-                else:
-                    label = tab_name
+            # Get counts for each manager shown in a tab
+            cached_counts = self.metadata_cache.get_package_counts()
+            counts = {
+                manager: cached_counts.get(manager, 0)
+                for managers in self.tab_managers.values() if managers
+                for manager in managers
+            }
+            total_count = sum(counts.values())
 
-                self.repo_tabs.setTabText(i, label)
+            # Update tab labels - None means the tab covers all managers
+            for i, tab_name in enumerate(self._tab_name_order):
+                managers = self.tab_managers[tab_name]
+                count = total_count if managers is None else sum(counts[m] for m in managers)
+                self.repo_tabs.setTabText(i, f"{tab_name} ({count:,})" if count > 0 else tab_name)
 
         except Exception as e:
             print(f"[MainWindow] Error updating tab counts: {e}")
@@ -375,12 +1215,11 @@ class WinPacManMainWindow(QMainWindow):
         from datetime import datetime
 
         # Helper function to format time ago
-        def format_time_ago(dt: datetime) -> str:
-            """Format datetime as 'X time ago' string."""
+        def format_time_ago(dt: datetime, now: datetime) -> str:
+            """Format datetime as 'X time ago' string relative to now."""
             if not dt:
                 return "Never"
 
-            now = datetime.now()
             delta = now - dt
 
             seconds = delta.total_seconds()
@@ -415,202 +1254,157 @@ class WinPacManMainWindow(QMainWindow):
         title_label = QLabel("<h2>Package Cache Summary</h2>")
         layout.addWidget(title_label)
 
-        # Create table with refresh button column
-        table = QTableWidget()
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels(["Provider", "Package Count", "Last Updated", "Actions"])
+        # Create table view with refresh button column
+        summary_model = CacheSummaryModel(dialog)
+        table = QTableView()
+        table.setModel(summary_model)
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         table.verticalHeader().setVisible(False)
-        table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setDefaultSectionSize(30)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        # Refresh buttons on provider rows (index widgets are dropped on model reset)
+        refresh_buttons: List[QPushButton] = []
+
+        # Use closure to capture manager_name
+        def make_refresh_handler(mgr_name, mgr_display):
+            def handler():
+                refresh_provider(mgr_name, mgr_display)
+            return handler
 
         # Function to refresh table data
         def refresh_table_data():
-            """Update table with current cache data."""
-            # Clear existing rows
-            table.setRowCount(0)
-
+            """Rebuild the summary rows with current cache data."""
+            rows = []
             provider_total = 0
-            row_index = 0
 
-            # Populate provider rows
+            # Provider rows (one query each for all counts and timestamps)
+            counts = self.metadata_cache.get_package_counts()
+            freshness_by_manager = self.metadata_cache.get_cache_freshness_all()
+            now = datetime.now()
             for display_name, manager_name in providers:
-                count = self.metadata_cache.get_package_count(manager_name)
-                freshness = self.metadata_cache.get_cache_freshness(manager_name)
-                freshness_str = format_time_ago(freshness)
-
+                count = counts.get(manager_name, 0)
+                freshness = freshness_by_manager.get(manager_name)
                 provider_total += count
+                rows.append(('provider', (display_name, f"{count:,}", format_time_ago(freshness, now))))
 
-                table.insertRow(row_index)
-                table.setItem(row_index, 0, QTableWidgetItem(display_name))
-                table.setItem(row_index, 1, QTableWidgetItem(f"{count:,}"))
-                table.setItem(row_index, 2, QTableWidgetItem(freshness_str))
-
-                # Center align count and freshness columns
-                table.item(row_index, 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.item(row_index, 2).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # Add refresh button
-                refresh_btn = QPushButton("Refresh")
-                refresh_btn.setMaximumWidth(80)
-
-                # Use closure to capture manager_name
-                def make_refresh_handler(mgr_name, mgr_display):
-                    def handler():
-                        refresh_provider(mgr_name, mgr_display)
-                    return handler
-
-                refresh_btn.clicked.connect(make_refresh_handler(manager_name, display_name))
-                table.setCellWidget(row_index, 3, refresh_btn)
-
-                row_index += 1
-
-            # Add separator row
-            table.insertRow(row_index)
-            for col in range(4):
-                table.setItem(row_index, col, QTableWidgetItem(""))
-                table.item(row_index, col).setBackground(Qt.GlobalColor.lightGray)
-            table.setRowHeight(row_index, 2)
-            row_index += 1
-
-            # Add installed packages row
-            installed_packages = self.metadata_cache.get_installed_packages()
-            installed_count = len(installed_packages)
-
-            table.insertRow(row_index)
-            table.setItem(row_index, 0, QTableWidgetItem("Installed"))
-            table.setItem(row_index, 1, QTableWidgetItem(f"{installed_count:,}"))
-            table.setItem(row_index, 2, QTableWidgetItem("Live"))
-            table.setItem(row_index, 3, QTableWidgetItem(""))
-
-            # Bold the installed row
-            font = table.item(row_index, 0).font()
-            font.setBold(True)
-            for col in range(3):
-                table.item(row_index, col).setFont(font)
-            table.item(row_index, 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.item(row_index, 2).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            row_index += 1
-
-            # Add another separator
-            table.insertRow(row_index)
-            for col in range(4):
-                table.setItem(row_index, col, QTableWidgetItem(""))
-                table.item(row_index, col).setBackground(Qt.GlobalColor.lightGray)
-            table.setRowHeight(row_index, 2)
-            row_index += 1
-
-            # Add total row
-            total_count = provider_total + installed_count
-            table.insertRow(row_index)
-            table.setItem(row_index, 0, QTableWidgetItem("Total"))
-            table.setItem(row_index, 1, QTableWidgetItem(f"{total_count:,}"))
-            table.setItem(row_index, 2, QTableWidgetItem(""))
-            table.setItem(row_index, 3, QTableWidgetItem(""))
-
-            # Bold the total row
-            font = table.item(row_index, 0).font()
-            font.setBold(True)
-            for col in range(3):
-                table.item(row_index, col).setFont(font)
-            table.item(row_index, 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Function to refresh a specific provider
-        def refresh_provider(manager_name: str, display_name: str):
-            """Refresh cache for a specific provider."""
-            # Disable all refresh buttons during operation
-            for row in range(table.rowCount()):
-                widget = table.cellWidget(row, 3)
-                if widget and isinstance(widget, QPushButton):
-                    widget.setEnabled(False)
+            # Installed packages row
+            installed_count = len(self.metadata_cache.get_installed_packages())
+            rows.append(('separator', ("", "", "")))
+            rows.append(('installed', ("Installed", f"{installed_count:,}", "Live")))
 
-            # Show progress in status
-            title_label.setText(f"<h2>Package Cache Summary - Refreshing {display_name}...</h2>")
-            QApplication.processEvents()
+            # Total row
+            total_count = provider_total + installed_count
+            rows.append(('separator', ("", "", "")))
+            rows.append(('total', ("Total", f"{total_count:,}", "")))
 
+            # Batch the reset, index widgets and row sizing into one repaint
+            table.setUpdatesEnabled(False)
             try:
-                # Prevent system sleep during cache refresh
-                with WindowsPowerManager.prevent_sleep():
-                    # Refresh the cache
-                    self.metadata_cache.refresh_cache(manager=manager_name, force=True)
-
-                # Update table data
-                refresh_table_data()
+                summary_model.set_rows(rows)
+
+                # Re-attach refresh buttons and shrink separator rows
+                refresh_buttons.clear()
+                for row, (display_name, manager_name) in enumerate(providers):
+                    refresh_btn = QPushButton("Refresh")
+                    refresh_btn.setMaximumWidth(80)
+                    refresh_btn.setEnabled(self._cache_refresh_worker is None)
+                    refresh_btn.clicked.connect(make_refresh_handler(manager_name, display_name))
+                    table.setIndexWidget(summary_model.index(row, 3), refresh_btn)
+                    refresh_buttons.append(refresh_btn)
+
+                for row in range(summary_model.rowCount()):
+                    if summary_model.row_kind(row) == 'separator':
+                        # One spanned cell per separator instead of four
+                        if table.columnSpan(row, 0) != 4:
+                            table.setSpan(row, 0, 1, 4)
+                        table.setRowHeight(row, 2)
+            finally:
+                table.setUpdatesEnabled(True)
+
+        # Function to run a cache refresh in the background
+        def start_refresh(managers: List[str], busy_text: str, done_text: str):
+            """Refresh the given providers on a CacheRefreshWorker thread."""
+            if self._cache_refresh_worker is not None:
+                return
 
-                # Update tab counts in main window
-                self.update_tab_counts()
+            # Disable buttons while the worker runs
+            refresh_all_btn.setEnabled(False)
+            for refresh_btn in refresh_buttons:
+                refresh_btn.setEnabled(False)
 
-                # Show success
-                title_label.setText(f"<h2>Package Cache Summary - {display_name} Refreshed ✓</h2>")
+            title_label.setText(f"<h2>Package Cache Summary - {busy_text}</h2>")
 
-                # Reset title after 2 seconds
-                QTimer.singleShot(2000, lambda: title_label.setText("<h2>Package Cache Summary</h2>"))
+            errors: List[str] = []
 
-            except Exception as e:
-                # Show error
-                title_label.setText("<h2>Package Cache Summary</h2>")
-                QMessageBox.critical(
-                    dialog,
-                    "Refresh Failed",
-                    f"Failed to refresh {display_name} cache:\n{str(e)}"
+            def on_progress(manager_name: str):
+                if len(managers) == 1:
+                    return
+                title_label.setText(
+                    f"<h2>Package Cache Summary - Refreshing {display_names[manager_name]}...</h2>"
                 )
 
-            # Re-enable all refresh buttons
-            for row in range(table.rowCount()):
-                widget = table.cellWidget(row, 3)
-                if widget and isinstance(widget, QPushButton):
-                    widget.setEnabled(True)
-
-        # Function to refresh all providers
-        def refresh_all_providers():
-            """Refresh cache for all providers."""
-            # Disable buttons
-            refresh_all_btn.setEnabled(False)
-            for row in range(table.rowCount()):
-                widget = table.cellWidget(row, 3)
-                if widget and isinstance(widget, QPushButton):
-                    widget.setEnabled(False)
-
-            title_label.setText("<h2>Package Cache Summary - Refreshing All Providers...</h2>")
-            QApplication.processEvents()
-
-            try:
-                # Prevent system sleep during all cache refreshes
-                with WindowsPowerManager.prevent_sleep():
-                    # Refresh all providers
-                    for display_name, manager_name in providers:
-                        title_label.setText(f"<h2>Package Cache Summary - Refreshing {display_name}...</h2>")
-                        QApplication.processEvents()
-                        self.metadata_cache.refresh_cache(manager=manager_name, force=True)
-
-                # Update table data
+            def on_manager_done(manager_name: str, count: int):
+                # Update table data and tab counts as each provider lands
                 refresh_table_data()
-
-                # Update tab counts in main window
                 self.update_tab_counts()
 
-                # Show success
-                title_label.setText("<h2>Package Cache Summary - All Providers Refreshed ✓</h2>")
-                QTimer.singleShot(2000, lambda: title_label.setText("<h2>Package Cache Summary</h2>"))
+            def on_error(manager_name: str, message: str):
+                errors.append(f"{display_names[manager_name]}: {message}")
+
+            def on_finished():
+                # finished is emitted from run(), so the thread may not have exited yet
+                self._cache_refresh_worker.wait()
+                self._cache_refresh_worker.deleteLater()
+                self._cache_refresh_worker = None
+
+                if errors:
+                    title_label.setText("<h2>Package Cache Summary</h2>")
+                    self._show_error_box(
+                        dialog,
+                        "Refresh Failed",
+                        "Failed to refresh cache:\n" + "\n".join(errors)
+                    )
+                else:
+                    # Show success, reset title after 2 seconds
+                    title_label.setText(f"<h2>Package Cache Summary - {done_text} ✓</h2>")
+                    QTimer.singleShot(2000, lambda: title_label.setText("<h2>Package Cache Summary</h2>"))
+
+            worker = CacheRefreshWorker(self.metadata_cache, managers)
+            worker.signals.progress.connect(on_progress)
+            worker.signals.manager_done.connect(on_manager_done)
+            worker.signals.error_occurred.connect(on_error)
+            worker.signals.finished.connect(on_finished)
+            self._cache_refresh_worker = worker
+            watch_refresh(worker)
+            worker.start()
+
+        # Re-enable this dialog's buttons once the running refresh ends. Connected
+        # after the worker's owner handler, which clears _cache_refresh_worker.
+        def on_watched_refresh_finished():
+            refresh_table_data()
+            refresh_all_btn.setEnabled(self._cache_refresh_worker is None)
+
+        def watch_refresh(worker: CacheRefreshWorker):
+            worker.signals.finished.connect(on_watched_refresh_finished)
 
-            except Exception as e:
-                title_label.setText("<h2>Package Cache Summary</h2>")
-                QMessageBox.critical(
-                    dialog,
-                    "Refresh Failed",
-                    f"Failed to refresh cache:\n{str(e)}"
-                )
+        # Function to refresh a specific provider
+        def refresh_provider(manager_name: str, display_name: str):
+            """Refresh cache for a specific provider."""
+            start_refresh([manager_name], f"Refreshing {display_name}...", f"{display_name} Refreshed")
 
-            # Re-enable buttons
-            refresh_all_btn.setEnabled(True)
-            for row in range(table.rowCount()):
-                widget = table.cellWidget(row, 3)
-                if widget and isinstance(widget, QPushButton):
-                    widget.setEnabled(True)
+        # Function to refresh all providers
+        def refresh_all_providers():
+            """Refresh cache for all providers."""
+            start_refresh(
+                [manager_name for _, manager_name in providers],
+                "Refreshing All Providers...",
+                "All Providers Refreshed"
+            )
 
         # Get data for each provider
         providers = [
@@ -620,6 +1414,7 @@ class WinPacManMainWindow(QMainWindow):
             ('NPM', 'npm'),
             ('Cargo', 'cargo')
         ]
+        display_names = {manager_name: display_name for display_name, manager_name in providers}
 
         # Initial table population
         refresh_table_data()
@@ -631,9 +1426,14 @@ class WinPacManMainWindow(QMainWindow):
 
         # Refresh All button
         refresh_all_btn = QPushButton("Refresh All")
+        refresh_all_btn.setEnabled(self._cache_refresh_worker is None)
         refresh_all_btn.clicked.connect(refresh_all_providers)
         button_layout.addWidget(refresh_all_btn)
 
+        # Opened while a refresh is running (e.g. started from an earlier dialog)
+        if self._cache_refresh_worker is not None:
+            watch_refresh(self._cache_refresh_worker)
+
         button_layout.addStretch()
 
         # Close button
@@ -648,35 +1448,16 @@ class WinPacManMainWindow(QMainWindow):
     def get_active_tab_name(self) -> str:
         """Get the name of the currently active tab (without count)."""
         index = self.repo_tabs.currentIndex()
-        return list(self.tab_managers.keys())[index]
+        return self._tab_name_order[index]
 
     def get_active_managers(self) -> Optional[List[str]]:
         """Get the list of managers for the active tab (None means all)."""
         index = self.repo_tabs.currentIndex()
-        tab_name = list(self.tab_managers.keys())[index]
-        return self.tab_managers.get(tab_name)
+        return self.tab_managers.get(self._tab_name_order[index])
 
     def _get_version_info(self) -> str:
         """Extract version and date from CHANGELOG.md for display."""
-        import os
-        import re
-
-        changelog_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "CHANGELOG.md")
-        version = "Unknown"
-        date_time = "Unknown"
-
-        if os.path.exists(changelog_path):
-            try:
-                with open(changelog_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for first version line: ## [0.3.0] - 2025-12-26 21:20
-                    match = re.search(r'##\s+\[([^\]]+)\]\s+-\s+(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2})?)', content)
-                    if match:
-                        version = match.group(1)
-                        date_time = match.group(2)
-            except Exception:
-                pass
-
+        version, date_time = _read_changelog_version()
         return f"v{version} ({date_time})"
 
     def list_installed_packages(self):
@@ -713,7 +1494,7 @@ class WinPacManMainWindow(QMainWindow):
                 return
 
             # Convert to Package objects with smart manager resolution
-            packages = [m.to_package(cache_service=self.metadata_cache) for m in installed]
+            packages = self.metadata_cache.build_packages(installed)
 
             # Store and display in shared table
             self.current_packages = packages
@@ -756,60 +1537,63 @@ class WinPacManMainWindow(QMainWindow):
             )
             return
 
-        # Show progress
-        self.status_label.setText("Scanning Windows Registry for installed packages...")
-        self.progress_label.setVisible(True)
-        self.progress_label.setText("⏳ Scanning registry...")
-        QApplication.processEvents()
+        # Show progress (busy indicator keeps animating while the worker scans)
+        self.on_operation_started("Scanning Windows Registry for installed packages...")
+        self._set_progress_message("Scanning registry...")
 
-        try:
-            # Sync installed packages from registry (fast: 1-2 seconds)
-            self.metadata_cache.sync_installed_packages_from_registry(validate=True)
-
-            # Get installed packages from cache
-            tab_name = self.get_active_tab_name()
-            managers_filter = self.get_active_managers()
-
-            installed = self.metadata_cache.get_installed_packages(managers=managers_filter)
-
-            # Convert to Package objects with smart manager resolution
-            packages = [m.to_package(cache_service=self.metadata_cache) for m in installed]
-
-            # Store and display in shared table
-            self.current_packages = packages
-            self.package_table.set_packages(packages)
-            self.table_mode = 'installed'  # Track that table now shows installed packages
-
-            # Disable both buttons until a package is selected
-            self.install_btn.setEnabled(False)
-            self.uninstall_btn.setEnabled(False)
-            self.selected_package = None
+        # Sync installed packages from registry off the GUI thread
+        self.current_worker = InstalledPackagesWorker(
+            self.metadata_cache,
+            managers=self.get_active_managers(),
+            sync=True
+        )
+        self.current_worker.signals.packages_loaded.connect(self._on_installed_packages_refreshed)
+        self.current_worker.signals.error_occurred.connect(self._on_installed_packages_error)
+        self.current_worker.signals.finished.connect(self.on_operation_finished)
+        self.current_worker.start()
 
-            # Update status
-            package_word = "package" if len(packages) == 1 else "packages"
-            source_desc = tab_name if managers_filter else "All Packages"
-            self.persistent_status = f"{len(packages)} installed {package_word} (refreshed)"
-            self.status_label.setText(self.persistent_status)
-            self.progress_label.setVisible(False)
+    @pyqtSlot(list)
+    def _on_installed_packages_refreshed(self, packages: List[Package]):
+        """Display installed packages after a registry refresh."""
+        # Store and display in shared table
+        self.current_packages = packages
+        self.package_table.set_packages(packages)
+        self.table_mode = 'installed'  # Track that table now shows installed packages
+
+        # Disable both buttons until a package is selected
+        self.install_btn.setEnabled(False)
+        self.uninstall_btn.setEnabled(False)
+        self.selected_package = None
 
-            print(f"[MainWindow] Refreshed {len(packages)} installed packages from registry")
+        # Update status
+        package_word = "package" if len(packages) == 1 else "packages"
+        self.persistent_status = f"{len(packages)} installed {package_word} (refreshed)"
+        self.status_label.setText(self.persistent_status)
 
-        except Exception as e:
-            print(f"[MainWindow] Error refreshing installed packages: {e}")
-            import traceback
-            traceback.print_exc()
+        print(f"[MainWindow] Refreshed {len(packages)} installed packages from registry")
 
-            self.progress_label.setVisible(False)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to refresh installed packages:\n{str(e)}"
-            )
+    @pyqtSlot(str)
+    def _on_installed_packages_error(self, error_message: str):
+        """Report a failed installed packages refresh."""
+        print(f"[MainWindow] Error refreshing installed packages: {error_message}")
+        self.status_label.setText(self.persistent_status)
+        self._show_error_box(
+            self,
+            "Error",
+            f"Failed to refresh installed packages:\n{error_message}"
+        )
 
     def on_package_selected(self, package: Package):
         """Handle package selection - enable appropriate button based on table mode."""
         self.selected_package = package
 
+        # Warm the install location cache so the details dialog opens filled in
+        if package.manager == PackageManager.WINGET and package.status == PackageStatus.INSTALLED:
+            self._pending_install_path_id = package.id
+            self._install_path_prefetch.start()
+        else:
+            self._install_path_prefetch.stop()
+
         # Enable the appropriate button based on what's in the table
         if not self.operation_in_progress:
             if self.table_mode == 'installed':
@@ -841,8 +1625,23 @@ class WinPacManMainWindow(QMainWindow):
         """Handle repository tab change - clear table."""
         tab_name = self.repo_tabs.tabText(index)
 
+        # Drop a list still loading for the previous tab so it can't repopulate the table
+        if self.current_worker and self.current_worker.isRunning():
+            print("[MainWindow] Cancelling package list for previous tab")
+            self.current_worker.cancel()
+            try:
+                self.current_worker.signals.packages_loaded.disconnect()
+            except TypeError:
+                pass  # Nothing connected
+
+        # Results of a search started on the previous tab are no longer wanted
+        for worker in self._search_workers:
+            worker.cancel()
+        self._active_search_query = ""
+
         # Clear table
         self.package_table.clear_packages()
+        self.busy_indicator.setVisible(False)
         self.progress_label.setVisible(False)
         self.table_mode = None
 
@@ -858,11 +1657,24 @@ class WinPacManMainWindow(QMainWindow):
         self.search_input.setPlaceholderText(f"Search available packages in {tab_name}...")
 
     def on_search_text_changed(self, text: str):
-        """Handle search text changes - trigger search on Enter or button click only."""
+        """Handle search text changes - filter the table; search on Enter or button click only."""
+        # Restart the debounce timer; state is applied once typing pauses
+        self._pending_search_text = text
+        self._search_debounce.start()
+
+    def _apply_search_state(self):
+        """Apply search box state after the user stops typing."""
         # Enable/disable search button based on input
-        self.search_btn.setEnabled(len(text.strip()) > 0)
+        self.search_btn.setEnabled(len(self._pending_search_text.strip()) > 0)
+
+        # Narrow the rows already in the table; Search/Enter still queries the cache
+        self.package_table.set_filter_text(self._pending_search_text)
 
     def search_packages(self):
+        """Request a search; repeated requests within 200ms run only once."""
+        self._search_request_timer.start()
+
+    def _do_search_now(self):
         """Search available packages and display in the shared table."""
         query = self.search_input.text().strip()
 
@@ -876,8 +1688,6 @@ class WinPacManMainWindow(QMainWindow):
 
         print(f"[MainWindow] Searching for '{query}' in available packages ({tab_name})")
 
-        repo_text = tab_name.lower()
-
         try:
             # Check if cache needs refresh
             cache_count = self.metadata_cache.get_package_count('winget')
@@ -893,42 +1703,13 @@ class WinPacManMainWindow(QMainWindow):
                 )
 
                 if reply == QMessageBox.StandardButton.Yes:
+                    # Search again once the background refresh finishes
+                    self._search_after_cache_refresh = True
                     self.refresh_metadata_cache()
-                    # After refresh, search again
-                    self.search_packages()
                 return
 
-            # Search the cache with selected repositories
-            results = self.metadata_cache.search(query, managers=managers_filter, limit=100)
-
-            if results:
-                # Convert to Package objects
-                packages = [metadata.to_package(cache_service=self.metadata_cache) for metadata in results]
-
-                # Store and display in shared table
-                self.current_packages = packages
-                self.package_table.set_packages(packages)
-                self.table_mode = 'available'  # Track that table now shows available packages
-
-                # Disable both buttons until a package is selected
-                self.install_btn.setEnabled(False)
-                self.uninstall_btn.setEnabled(False)
-                self.selected_package = None
-
-                self.persistent_status = f"Found {len(packages)} results for '{query}' in {repo_text}"
-                self.status_label.setText(self.persistent_status)
-
-                print(f"[MainWindow] Found {len(packages)} results from {repo_text}")
-            else:
-                self.package_table.clear_packages()
-                self.table_mode = None
-                self.persistent_status = f"No results found for '{query}' in {repo_text}"
-                self.status_label.setText(self.persistent_status)
-                QMessageBox.information(
-                    self,
-                    "No Results",
-                    f"No packages found matching '{query}' in {repo_text}."
-                )
+            # Search the cache with selected repositories (off the GUI thread)
+            self._start_search(query, managers_filter)
 
         except Exception as e:
             print(f"[MainWindow] Search error: {e}")
@@ -940,40 +1721,159 @@ class WinPacManMainWindow(QMainWindow):
                 f"An error occurred while searching: {str(e)}"
             )
 
+    def _start_search(self, query: str, managers_filter: Optional[List[str]]):
+        """Run a cache search on a SearchWorker, superseding any search in flight."""
+        for worker in self._search_workers:
+            worker.cancel()
 
-    def refresh_metadata_cache(self):
-        """Refresh the metadata cache from providers."""
-        print("[MainWindow] Refreshing metadata cache...")
+        self._active_search_query = query
+        self.status_label.setText(f"Searching for '{query}'...")
 
-        # Show progress
-        self.status_label.setText("Refreshing package metadata cache...")
-        QApplication.processEvents()  # Update UI
+        worker = SearchWorker(self.metadata_cache, query, managers_filter, 100)
+        worker.signals.results_ready.connect(self._on_search_results)
+        worker.signals.error_occurred.connect(self._on_search_error)
+        worker.finished.connect(lambda worker=worker: self._on_search_worker_finished(worker))
+        self._search_workers.append(worker)
+        worker.start()
 
-        try:
-            # Prevent system sleep during cache refresh
-            with WindowsPowerManager.prevent_sleep():
-                for provider in self.metadata_cache.providers:
-                    self.metadata_cache.refresh_cache(manager=provider.get_manager_name(), force=True)
+    def _on_search_worker_finished(self, worker):
+        """Release a finished search worker."""
+        if worker in self._search_workers:
+            self._search_workers.remove(worker)
+        worker.deleteLater()
+
+    @pyqtSlot(list, str)
+    def _on_search_results(self, packages: List[Package], query: str):
+        """Display search results in the shared table."""
+        if query != self._active_search_query:
+            return  # Superseded by a newer search
+
+        repo_text = self.get_active_tab_name().lower()
 
-            total_count = self.metadata_cache.get_package_count()
-            self.status_label.setText(f"Cache refreshed: {total_count} packages indexed")
+        if packages:
+            # Store and display in shared table
+            self.current_packages = packages
+            self.package_table.set_packages(packages)
+            self.table_mode = 'available'  # Track that table now shows available packages
 
+            # Disable both buttons until a package is selected
+            self.install_btn.setEnabled(False)
+            self.uninstall_btn.setEnabled(False)
+            self.selected_package = None
+
+            self.persistent_status = f"Found {len(packages)} results for '{query}' in {repo_text}"
+            self.status_label.setText(self.persistent_status)
+
+            print(f"[MainWindow] Found {len(packages)} results from {repo_text}")
+        else:
+            self.package_table.clear_packages()
+            self.table_mode = None
+            self.persistent_status = f"No results found for '{query}' in {repo_text}"
+            self.status_label.setText(self.persistent_status)
             QMessageBox.information(
                 self,
-                "Cache Refreshed",
-                f"Successfully cached {total_count} packages."
+                "No Results",
+                f"No packages found matching '{query}' in {repo_text}."
             )
 
-        except Exception as e:
-            print(f"[MainWindow] Cache refresh error: {e}")
-            import traceback
-            traceback.print_exc()
+    @pyqtSlot(str, str)
+    def _on_search_error(self, error_message: str, query: str):
+        """Report a failed search."""
+        if query != self._active_search_query:
+            return
+
+        print(f"[MainWindow] Search error: {error_message}")
+        self.status_label.setText(self.persistent_status)
+        QMessageBox.critical(
+            self,
+            "Search Error",
+            f"An error occurred while searching: {error_message}"
+        )
+
+    def refresh_metadata_cache(self):
+        """Refresh the metadata cache from providers (on a CacheRefreshWorker)."""
+        print("[MainWindow] Refreshing metadata cache...")
+        if self.operation_in_progress or self._cache_refresh_worker is not None:
+            QMessageBox.warning(
+                self,
+                "Operation In Progress",
+                "Please wait for the current operation to complete."
+            )
+            self._search_after_cache_refresh = False
+            return
+
+        # Show progress
+        self.on_operation_started("Refreshing package metadata cache...")
+        self._cache_refresh_errors = []
+
+        managers = [provider.get_manager_name() for provider in self.metadata_cache.providers]
+        self._cache_refresh_pending = len(managers)
+
+        worker = CacheRefreshWorker(self.metadata_cache, managers)
+        worker.signals.progress.connect(self._on_cache_refresh_progress)
+        worker.signals.manager_done.connect(self._on_cache_refresh_manager_done)
+        worker.signals.error_occurred.connect(self._on_cache_refresh_error)
+        worker.signals.finished.connect(self._on_cache_refresh_finished)
+        self._cache_refresh_worker = worker
+        worker.start()
+
+    @pyqtSlot(str)
+    def _on_cache_refresh_progress(self, manager: str):
+        """Show which provider is being refreshed."""
+        self._set_progress_message(f"Refreshing {MANAGER_DISPLAY_NAMES.get(manager, manager)}...")
+
+    @pyqtSlot(str, int)
+    def _on_cache_refresh_manager_done(self, manager: str, count: int):
+        """Report a provider whose cache has been refreshed."""
+        self._cache_refresh_pending -= 1
+        self.status_label.setText(
+            f"Cached {count:,} packages from {MANAGER_DISPLAY_NAMES.get(manager, manager)} "
+            f"({self._cache_refresh_pending} remaining)"
+        )
+
+    @pyqtSlot(str, str)
+    def _on_cache_refresh_error(self, manager: str, message: str):
+        """Collect a provider refresh failure."""
+        self._cache_refresh_pending -= 1
+        self._cache_refresh_errors.append(f"{MANAGER_DISPLAY_NAMES.get(manager, manager)}: {message}")
+
+    @pyqtSlot()
+    def _on_cache_refresh_finished(self):
+        """Finish a metadata cache refresh started from the menu."""
+        self._cache_refresh_worker.wait()
+        self._cache_refresh_worker.deleteLater()
+        self._cache_refresh_worker = None
+        self.on_operation_finished()
+        self.update_tab_counts()
+
+        search_after = self._search_after_cache_refresh
+        self._search_after_cache_refresh = False
+
+        # The window is closing; don't pop up results
+        if self._closing:
+            return
+
+        if self._cache_refresh_errors:
+            self.status_label.setText(self.persistent_status)
             QMessageBox.critical(
                 self,
                 "Cache Error",
-                f"An error occurred while refreshing cache: {str(e)}"
+                "An error occurred while refreshing cache:\n" + "\n".join(self._cache_refresh_errors)
             )
+            return
 
+        total_count = self.metadata_cache.get_package_count()
+        self.status_label.setText(f"Cache refreshed: {total_count} packages indexed")
+
+        QMessageBox.information(
+            self,
+            "Cache Refreshed",
+            f"Successfully cached {total_count} packages."
+        )
+
+        # Finish a search that was waiting for the cache to be initialized
+        if search_after:
+            self.search_packages()
 
     def on_verbose_toggled(self, checked: bool):
         """Handle verbose mode menu toggle."""
@@ -1050,28 +1950,11 @@ class WinPacManMainWindow(QMainWindow):
             )
             return
 
-        # 4. Create worker
-        self.current_install_worker = PackageInstallWorker(
-            self.package_service,
-            package_to_install.manager,
-            package_to_install.id
-        )
-
-        # 5. Connect signals
-        self.current_install_worker.signals.started.connect(
-            lambda: self.on_operation_started(f"Installing {package_to_install.name}...")
-        )
-        self.current_install_worker.signals.progress.connect(self.on_progress_update)
-        self.current_install_worker.signals.operation_complete.connect(
-            self.on_install_complete
-        )
-        self.current_install_worker.signals.error_occurred.connect(self.on_error)
-        self.current_install_worker.signals.finished.connect(
-            self.on_operation_finished
-        )
-
-        # 6. Start worker
-        self.current_install_worker.start()
+        # 4. Queue on the worker thread
+        self.operation_in_progress = True
+        self.pending_operation = 'install'
+        self.pending_operation_message = f"Installing {package_to_install.name}..."
+        self._request_install.emit(package_to_install.manager, package_to_install.id)
 
     def uninstall_package(self):
         """Uninstall selected package."""
@@ -1107,34 +1990,17 @@ class WinPacManMainWindow(QMainWindow):
             )
             return
 
-        # 4. Create worker
-        self.current_uninstall_worker = PackageUninstallWorker(
-            self.package_service,
-            self.selected_package.manager,
-            self.selected_package.id
-        )
-
-        # 5. Connect signals
-        self.current_uninstall_worker.signals.started.connect(
-            lambda: self.on_operation_started(f"Uninstalling {self.selected_package.name}...")
-        )
-        self.current_uninstall_worker.signals.progress.connect(self.on_progress_update)
-        self.current_uninstall_worker.signals.operation_complete.connect(
-            self.on_uninstall_complete
-        )
-        self.current_uninstall_worker.signals.error_occurred.connect(self.on_error)
-        self.current_uninstall_worker.signals.finished.connect(
-            self.on_operation_finished
-        )
-
-        # 6. Start worker
-        self.current_uninstall_worker.start()
+        # 4. Queue on the worker thread
+        self.operation_in_progress = True
+        self.pending_operation = 'uninstall'
+        self.pending_operation_message = f"Uninstalling {self.selected_package.name}..."
+        self._request_uninstall.emit(self.selected_package.manager, self.selected_package.id)
 
-    def _update_spinner(self):
-        """Update animated spinner (called by timer)."""
-        self.spinner_index = (self.spinner_index + 1) % len(self.spinner_frames)
-        spinner = self.spinner_frames[self.spinner_index]
-        self.progress_label.setText(f"{spinner} {self.progress_message}")
+    def _set_progress_message(self, message: str):
+        """Show a progress message next to the busy indicator."""
+        if message != self.progress_message:
+            self.progress_message = message
+            self.progress_label.setText(message)
 
     @pyqtSlot(str)
     def on_operation_started(self, message: str):
@@ -1145,23 +2011,32 @@ class WinPacManMainWindow(QMainWindow):
         self.status_label.setText(message)
         self.progress_label.setVisible(True)
 
-        # Start animated spinner
-        self.progress_message = "Starting..."
-        self.spinner_index = 0
-        self.spinner_timer.start(100)  # Update every 100ms
+        # Show busy indicator (animated by Qt)
+        self._set_progress_message("Starting...")
+        self.busy_indicator.setVisible(True)
+
+    @pyqtSlot()
+    def _on_package_operation_started(self):
+        """Handle start of a queued install/uninstall on the worker thread."""
+        self.on_operation_started(self.pending_operation_message)
+
+    @pyqtSlot(object)
+    def _on_package_operation_complete(self, result):
+        """Route a worker result to the install or uninstall handler."""
+        if self.pending_operation == 'uninstall':
+            self.on_uninstall_complete(result)
+        else:
+            self.on_install_complete(result)
 
     @pyqtSlot(int, int, str)
     def on_progress_update(self, current: int, total: int, message: str):
         """Handle progress update (thread-safe via signal)."""
         print(f"[MainWindow] on_progress_update: {current}/{total} - {message}")
 
-        # Update progress message (spinner updates automatically via timer)
-        self.progress_message = message
+        # Update progress message (busy indicator animates on its own)
+        self._set_progress_message(message)
         self.status_label.setText(message)
 
-        # Force UI to update immediately
-        QApplication.processEvents()
-
     @pyqtSlot(list)
     def on_packages_loaded(self, packages: List[Package]):
         """Handle loaded packages (legacy method - kept for compatibility)."""
@@ -1172,6 +2047,9 @@ class WinPacManMainWindow(QMainWindow):
     @pyqtSlot(object)
     def on_install_complete(self, result):
         """Handle installation completion."""
+        # Installed software changed - drop memoized install locations
+        _clear_install_location_caches()
+
         # Log the operation
         self._log_operation(result)
 
@@ -1197,6 +2075,9 @@ class WinPacManMainWindow(QMainWindow):
     @pyqtSlot(object)
     def on_uninstall_complete(self, result):
         """Handle uninstallation completion."""
+        # Installed software changed - drop memoized install locations
+        _clear_install_location_caches()
+
         # Log the operation
         self._log_operation(result)
 
@@ -1219,6 +2100,25 @@ class WinPacManMainWindow(QMainWindow):
                 result.message
             )
 
+    def _show_error_box(self, parent: QWidget, title: str, message: str):
+        """
+        Show a non-modal error message box.
+
+        Unlike QMessageBox.critical() this returns immediately, so callers
+        running from a worker's signal handlers do not block the event loop.
+
+        Args:
+            parent: Parent widget for the box
+            title: Window title
+            message: Error text
+        """
+        box = QMessageBox(QMessageBox.Icon.Critical, title, message,
+                          QMessageBox.StandardButton.Ok, parent)
+        box.setWindowModality(Qt.WindowModality.NonModal)
+        box.finished.connect(lambda _result, box=box: self._error_boxes.remove(box))
+        self._error_boxes.append(box)
+        box.show()
+
     @pyqtSlot(str)
     def on_error(self, error_message: str):
         """Handle error."""
@@ -1236,10 +2136,10 @@ class WinPacManMainWindow(QMainWindow):
         self.operation_in_progress = False
         self.enable_controls()
 
-        # Stop animated spinner
-        self.spinner_timer.stop()
+        # Hide busy indicator
+        self.busy_indicator.setVisible(False)
         self.progress_label.setVisible(False)
-        self.progress_label.setText("")
+        self._set_progress_message("")
 
         # Clean up worker
         if self.current_worker:
@@ -1247,409 +2147,46 @@ class WinPacManMainWindow(QMainWindow):
             self.current_worker.deleteLater()
             self.current_worker = None
 
-        # Clean up install worker
-        if self.current_install_worker:
-            self.current_install_worker.wait()
-            self.current_install_worker.deleteLater()
-            self.current_install_worker = None
-
-        # Clean up uninstall worker
-        if self.current_uninstall_worker:
-            self.current_uninstall_worker.wait()
-            self.current_uninstall_worker.deleteLater()
-            self.current_uninstall_worker = None
+        self.pending_operation = None
 
     def _get_winget_install_location(self, package_id: str) -> Optional[str]:
         """
         Get installation location for a WinGet package.
 
-        Strategy:
-        1. Try Windows Registry (for traditionally installed apps)
-        2. If not found, query WinGet directly (for WinGet-managed apps)
-
-        Uses very strict matching to avoid false positives. Better to show no path
-        than the wrong path.
+        Thin wrapper around the module-level, memoized _resolve_install_path.
         """
-        import winreg
-        import os
-        import re
-        import subprocess
-
-        def normalize_name(name: str) -> str:
-            """Normalize name by removing spaces, hyphens, and lowercasing."""
-            return re.sub(r'[\s\-_]', '', name.lower())
-
-        def get_install_path(app_key):
-            """Try to extract install location from registry key using multiple methods."""
-            # Method 1: InstallLocation field
-            try:
-                install_location = winreg.QueryValueEx(app_key, "InstallLocation")[0]
-                if install_location and install_location.strip() and os.path.exists(install_location.strip()):
-                    return install_location.strip()
-            except FileNotFoundError:
-                pass
-
-            # Method 2: InstallPath field
-            try:
-                install_path = winreg.QueryValueEx(app_key, "InstallPath")[0]
-                if install_path and install_path.strip() and os.path.exists(install_path.strip()):
-                    return install_path.strip()
-            except FileNotFoundError:
-                pass
-
-            # Method 3: Extract from UninstallString (often contains path to uninstaller)
-            try:
-                uninstall_string = winreg.QueryValueEx(app_key, "UninstallString")[0]
-                if uninstall_string:
-                    # Extract directory from uninstall path
-                    # e.g., "C:\Program Files\Vim\vim91\uninstall.exe" -> "C:\Program Files\Vim"
-                    match = re.search(r'^"?([A-Z]:[^"]+?)\\[^\\]+\.exe', uninstall_string, re.IGNORECASE)
-                    if match:
-                        path = match.group(1)
-
-                        # Decide whether to use path or parent directory
-                        # Check if path looks like a versioned subdirectory (e.g., "vim91", "v1.2.3")
-                        path_basename = os.path.basename(path).lower()
-
-                        # Patterns that indicate a versioned subdirectory
-                        is_version_subdir = (
-                            re.search(r'(^|[^a-z])(v?\d+\.?\d*|bin|app|x64|x86|win\d+)$', path_basename) or
-                            'uninstall' in path_basename
-                        )
-
-                        if is_version_subdir:
-                            # Use parent directory for versioned subdirs (e.g., vim91 -> Vim)
-                            parent = os.path.dirname(path)
-                            if parent and os.path.exists(parent):
-                                return parent
-
-                        # Use the extracted path itself
-                        if path and os.path.exists(path):
-                            return path
-            except FileNotFoundError:
-                pass
-
-            # Method 4: Extract from InstallString
-            try:
-                install_string = winreg.QueryValueEx(app_key, "InstallString")[0]
-                if install_string:
-                    match = re.search(r'^"?([A-Z]:[^"]+?)\\[^\\]+\.exe', install_string, re.IGNORECASE)
-                    if match:
-                        path = match.group(1)
-                        path_basename = os.path.basename(path).lower()
-
-                        # Check if path looks like a versioned subdirectory
-                        is_version_subdir = (
-                            re.search(r'(^|[^a-z])(v?\d+\.?\d*|bin|app|x64|x86|win\d+)$', path_basename) or
-                            'uninstall' in path_basename or
-                            'install' in path_basename
-                        )
-
-                        if is_version_subdir:
-                            parent = os.path.dirname(path)
-                            if parent and os.path.exists(parent):
-                                return parent
-
-                        if path and os.path.exists(path):
-                            return path
-            except FileNotFoundError:
-                pass
-
-            return None
-
-        try:
-            print(f"[InstallPath] Looking for: {package_id}")
-
-            # Skip package IDs that are just version numbers (e.g., "4.7.1", "1.2.3")
-            # These won't match anything meaningful in the registry
-            if re.match(r'^\d+(\.\d+)*$', package_id):
-                print(f"[InstallPath] Skipping version-only package ID")
-                return None
-
-            # Handle ARP (Add/Remove Programs) registry paths from WinGet
-            # Format: ARP\Machine\X64\PackageName or ARP\User\X64\PackageName
-            actual_package_id = package_id
-            target_hive = None  # None means search all hives
-
-            if package_id.startswith("ARP\\"):
-                parts = package_id.split("\\")
-                if len(parts) >= 4:
-                    # Extract: ARP\Machine\X64\Vim 9.1 -> "Vim 9.1"
-                    actual_package_id = "\\".join(parts[3:])
-
-                    # Determine which registry hive to search
-                    if parts[1].lower() == "machine":
-                        target_hive = "HKLM"
-                    elif parts[1].lower() == "user":
-                        target_hive = "HKCU"
-
-                    print(f"[InstallPath] Detected ARP format, extracted: {actual_package_id} (hive: {target_hive or 'all'})")
-
-            # Filter registry paths based on target hive
-            all_registry_paths = [
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "HKLM"),
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall", "HKLM"),
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", "HKCU"),
-            ]
-
-            # For ARP packages, search the indicated hive first, then fall back to all hives
-            # (WinGet's ARP path might not always be accurate)
-            if target_hive:
-                # Search target hive first
-                registry_paths = [(hkey, path) for hkey, path, hive in all_registry_paths if hive == target_hive]
-                # Then add other hives as fallback
-                registry_paths.extend([(hkey, path) for hkey, path, hive in all_registry_paths if hive != target_hive])
-                print(f"[InstallPath] Will search {target_hive} first, then other hives")
-            else:
-                registry_paths = [(hkey, path) for hkey, path, _ in all_registry_paths]
-
-            # Prepare search terms: full package ID and individual parts
-            package_id_normalized = normalize_name(actual_package_id)
-            package_parts = actual_package_id.split('.')
-
-            # Create list of search terms to try (in priority order)
-            search_terms = []
-
-            # For ARP packages, the package ID IS the subkey name - prioritize exact match
-            if package_id.startswith("ARP\\"):
-                # Try exact subkey match first with highest confidence
-                search_terms.append((actual_package_id, "arp_subkey", 120))  # Exact match (not normalized)
-                search_terms.append((package_id_normalized, "arp_normalized", 100))
-
-                # Also try just the base name without version numbers
-                # "Vim 9.1" -> "Vim"
-                base_name = re.sub(r'\s+\d+(\.\d+)*$', '', actual_package_id).strip()
-                if base_name and base_name != actual_package_id:
-                    search_terms.append((normalize_name(base_name), "arp_base", 90))
-                    print(f"[InstallPath] ARP base name: {base_name}")
-
-            elif len(package_parts) > 1:
-                # For "CPUID.HWMonitor", try: full ID, last part, first part
-                search_terms.append((package_id_normalized, "full_id", 100))  # Base confidence for full ID
-
-                # Only add parts that aren't just version numbers
-                last_part = package_parts[-1]
-                first_part = package_parts[0]
-
-                if not re.match(r'^\d+$', last_part) and len(last_part) > 2:
-                    search_terms.append((normalize_name(last_part), "product", 80))  # Product name
-
-                if not re.match(r'^\d+$', first_part) and len(first_part) > 2:
-                    search_terms.append((normalize_name(first_part), "publisher", 70))  # Publisher name
-
-            else:
-                # Single-part ID (if it's not a version number)
-                if len(actual_package_id) > 2:
-                    search_terms.append((package_id_normalized, "full_id", 100))
-
-            # If we ended up with no search terms, bail out
-            if not search_terms:
-                print(f"[InstallPath] No valid search terms could be generated")
-                return None
-
-            print(f"[InstallPath] Search terms: {[term for term, _, _ in search_terms]}")
-
-            # Collect all candidates with confidence scores
-            candidates = []
-            registry_entries_scanned = 0
-            registry_entries_total = 0  # Including those without paths
-            sample_entries = []  # For debug: collect sample of what we're checking
-            sample_all_entries = []  # All entries including those without install paths
-
-            for hkey, registry_path in registry_paths:
-                try:
-                    with winreg.OpenKey(hkey, registry_path) as reg_key:
-                        num_subkeys = winreg.QueryInfoKey(reg_key)[0]
-                        for i in range(num_subkeys):
-                            try:
-                                subkey_name = winreg.EnumKey(reg_key, i)
-                                with winreg.OpenKey(reg_key, subkey_name) as app_key:
-                                    try:
-                                        display_name = winreg.QueryValueEx(app_key, "DisplayName")[0]
-                                        install_path = get_install_path(app_key)
-
-                                        # Track ALL entries with DisplayName (even without install path)
-                                        if display_name:
-                                            registry_entries_total += 1
-                                            if len(sample_all_entries) < 20:
-                                                has_path = "[+]" if install_path else "[-]"
-                                                sample_all_entries.append(f"{has_path} {display_name} (subkey: {subkey_name})")
-
-                                        if not install_path or not display_name:
-                                            continue
-
-                                        registry_entries_scanned += 1
-
-                                        # Collect sample entries for debug (first 10)
-                                        if len(sample_entries) < 10:
-                                            sample_entries.append(f"{display_name} (subkey: {subkey_name})")
-
-                                        display_normalized = normalize_name(display_name)
-                                        subkey_normalized = normalize_name(subkey_name)
-
-                                        # Try each search term and use the highest confidence match
-                                        best_confidence = 0
-                                        match_reason = ""
-
-                                        for search_term, term_type, base_confidence in search_terms:
-                                            confidence = 0
-
-                                            # For ARP packages, check both subkey AND display name
-                                            if term_type in ["arp_subkey", "arp_normalized", "arp_base"]:
-                                                # Try exact subkey match (case-sensitive for arp_subkey)
-                                                if term_type == "arp_subkey":
-                                                    if search_term == subkey_name:
-                                                        confidence = base_confidence + 30
-                                                        match_reason = f"subkey_exact_arp"
-                                                    elif search_term.lower() == subkey_name.lower():
-                                                        confidence = base_confidence + 20
-                                                        match_reason = f"subkey_exact_arp_ci"
-                                                    # Also check display name for ARP exact match
-                                                    elif search_term == display_name:
-                                                        confidence = base_confidence + 25
-                                                        match_reason = f"display_exact_arp"
-                                                    elif search_term.lower() == display_name.lower():
-                                                        confidence = base_confidence + 15
-                                                        match_reason = f"display_exact_arp_ci"
-                                                else:
-                                                    # For normalized/base ARP terms, check normalized fields
-                                                    if search_term == subkey_normalized:
-                                                        confidence = base_confidence + 20
-                                                        match_reason = f"subkey_exact_{term_type}"
-                                                    elif search_term == display_normalized:
-                                                        confidence = base_confidence + 15
-                                                        match_reason = f"display_exact_{term_type}"
-                                                    elif display_normalized.startswith(search_term) and len(search_term) > 3:
-                                                        confidence = base_confidence + 5
-                                                        match_reason = f"display_starts_{term_type}"
-                                                    elif search_term in subkey_normalized and len(search_term) > 3:
-                                                        confidence = base_confidence
-                                                        match_reason = f"subkey_contains_{term_type}"
-
-                                            # Check registry subkey name (normalized) for non-ARP
-                                            elif search_term == subkey_normalized:
-                                                confidence = base_confidence + 20
-                                                match_reason = f"subkey_exact_{term_type}"
-                                            elif search_term in subkey_normalized and len(search_term) > 3:
-                                                confidence = base_confidence + 10
-                                                match_reason = f"subkey_contains_{term_type}"
-                                            # Check display name for non-ARP
-                                            elif display_normalized == search_term:
-                                                confidence = base_confidence
-                                                match_reason = f"display_exact_{term_type}"
-                                            elif display_normalized.startswith(search_term):
-                                                confidence = base_confidence - 10
-                                                match_reason = f"display_starts_{term_type}"
-                                            elif search_term in display_normalized and len(search_term) > 3:
-                                                # Only match if it's a whole word (surrounded by non-letters)
-                                                pattern = rf'(^|[^a-z]){re.escape(search_term)}($|[^a-z])'
-                                                if re.search(pattern, display_normalized):
-                                                    confidence = base_confidence - 20
-                                                    match_reason = f"display_word_{term_type}"
-
-                                            # Update best confidence
-                                            if confidence > best_confidence:
-                                                best_confidence = confidence
-                                                match_reason = match_reason
-
-                                        # Boost if install path contains any search term
-                                        if best_confidence > 0:
-                                            for search_term, term_type, _ in search_terms:
-                                                if search_term in install_path.lower() and len(search_term) > 3:
-                                                    best_confidence += 5
-                                                    break
-
-                                        # Only add if we have a reasonable match
-                                        if best_confidence >= 60:
-                                            candidates.append((best_confidence, display_name, install_path, match_reason, subkey_name))
-
-                                    except FileNotFoundError:
-                                        pass
-                            except OSError:
-                                continue
-                except FileNotFoundError:
-                    continue
+        return _resolve_install_path(package_id)
 
-            # Debug output
-            print(f"[InstallPath] Scanned {registry_entries_scanned} entries with install paths ({registry_entries_total} total entries)")
-            if not candidates and registry_entries_total > 0:
-                print(f"[InstallPath] Sample of ALL registry entries ([+]=has path, [-]=no path):")
-                for entry in sample_all_entries:
-                    print(f"  {entry}")
-
-            # Sort by confidence (highest first)
-            candidates.sort(key=lambda x: x[0], reverse=True)
-
-            if candidates:
-                print(f"[InstallPath] Found {len(candidates)} candidates:")
-                for conf, name, path, reason, subkey in candidates[:5]:  # Show top 5
-                    print(f"  [{conf}] {name}")
-                    print(f"       Reason: {reason}, Subkey: {subkey}")
-                    print(f"       Path: {path}")
-
-                # Only return if confidence is high enough (>= 70 to be more strict)
-                if candidates[0][0] >= 70:
-                    print(f"[InstallPath] [OK] Returning best match: {candidates[0][1]}")
-                    return candidates[0][2]
-                else:
-                    print(f"[InstallPath] [SKIP] Best match confidence too low ({candidates[0][0]}), returning None")
-            else:
-                print(f"[InstallPath] No candidates found in registry")
+    def _request_install_path(self, package_id: str):
+        """
+        Resolve a WinGet package's install location in the thread pool.
 
-            # Fallback: Query WinGet directly for installation location
-            # NOTE: Only works for WinGet-managed packages (not ARP entries)
-            if not package_id.startswith("ARP\\"):
-                print(f"[InstallPath] Trying winget show as fallback...")
-                try:
-                    result = subprocess.run(
-                        ['winget', 'show', '--id', package_id, '--accept-source-agreements'],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        encoding='utf-8',
-                        errors='ignore'
-                    )
+        Results are delivered via install_path_resolved; repeat lookups are
+        answered from the resolver's memo cache. Lookups already in flight
+        are not repeated.
+        """
+        if package_id in self._install_path_workers:
+            return
 
-                    if result.returncode == 0:
-                        # Parse output for "Install Location:" or "Installation Folder:"
-                        for line in result.stdout.splitlines():
-                            line_lower = line.lower().strip()
-                            if 'install location:' in line_lower or 'installation folder:' in line_lower:
-                                # Extract path after the colon
-                                parts = line.split(':', 1)
-                                if len(parts) == 2:
-                                    install_path = parts[1].strip()
-                                    if install_path and os.path.exists(install_path):
-                                        print(f"[InstallPath] [OK] Found via winget show: {install_path}")
-                                        return install_path
-                                    else:
-                                        print(f"[InstallPath] Path from winget doesn't exist: {install_path}")
-                        print(f"[InstallPath] winget show returned no install location")
-                    else:
-                        print(f"[InstallPath] winget show failed (exit code {result.returncode})")
+        worker = InstallPathWorker(package_id, self._get_winget_install_location)
+        worker.signals.install_path_ready.connect(self._on_install_path_ready)
+        self._install_path_workers[package_id] = worker
+        QThreadPool.globalInstance().start(worker)
 
-                except subprocess.TimeoutExpired:
-                    print(f"[InstallPath] winget show timed out")
-                except Exception as e:
-                    print(f"[InstallPath] winget show error: {e}")
-            else:
-                print(f"[InstallPath] ARP packages don't support winget show, skipping fallback")
+    def _prefetch_install_path(self):
+        """Start the install location lookup for the settled selection."""
+        if self._pending_install_path_id:
+            self._request_install_path(self._pending_install_path_id)
+            self._pending_install_path_id = None
 
-            return None
-
-        except Exception as e:
-            print(f"[InstallPath] ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+    @pyqtSlot(str, object)
+    def _on_install_path_ready(self, package_id: str, path):
+        """Pass an install location result on to listeners."""
+        self._install_path_workers.pop(package_id, None)
+        self.install_path_resolved.emit(package_id, path)
 
     def on_package_details(self, package: Package):
         """Show package details dialog with copy to clipboard functionality."""
-        # Get installation location for WinGet packages
-        install_location = None
-        if package.manager == PackageManager.WINGET:
-            install_location = self._get_winget_install_location(package.id)
-
         # Create custom dialog
         dialog = QDialog(self)
         dialog.setWindowTitle("Package Details")
@@ -1678,23 +2215,42 @@ class WinPacManMainWindow(QMainWindow):
         info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         layout.addWidget(info_label)
 
-        # Installation location section (if available)
-        if install_location:
+        # Installation location section (WinGet packages only)
+        # The location is resolved in the background; the dialog shows a
+        # placeholder until the lookup completes.
+        if package.manager == PackageManager.WINGET:
             layout.addSpacing(10)
 
             location_label = QLabel(f"<b>Installation Location:</b>")
             layout.addWidget(location_label)
 
-            path_label = QLabel(install_location)
+            path_label = QLabel("Resolving installation location...")
             path_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
             path_label.setStyleSheet("padding: 5px; background-color: palette(base); border: 1px solid palette(mid);")
             layout.addWidget(path_label)
 
             # Copy button
             copy_button = QPushButton("Copy Path to Clipboard")
-            copy_button.clicked.connect(lambda: self._copy_to_clipboard(install_location))
+            copy_button.setEnabled(False)
+            copy_button.clicked.connect(lambda: self._copy_to_clipboard(path_label.text()))
             layout.addWidget(copy_button)
 
+            def on_install_path_resolved(package_id: str, install_location):
+                if package_id != package.id:
+                    return
+                if install_location:
+                    path_label.setText(install_location)
+                    copy_button.setEnabled(True)
+                else:
+                    # Better to show no path than the wrong path
+                    location_label.setVisible(False)
+                    path_label.setVisible(False)
+                    copy_button.setVisible(False)
+
+            self.install_path_resolved.connect(on_install_path_resolved)
+            dialog.finished.connect(lambda _: self.install_path_resolved.disconnect(on_install_path_resolved))
+            self._request_install_path(package.id)
+
         # Close button
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(dialog.reject)
@@ -1712,25 +2268,19 @@ class WinPacManMainWindow(QMainWindow):
         Returns:
             Formatted display name (e.g., "WinGet", "Unknown")
         """
-        formatting_map = {
-            'winget': 'WinGet',
-            'chocolatey': 'Chocolatey',
-            'pip': 'Pip',
-            'npm': 'NPM',
-            'scoop': 'Scoop',
-            'msstore': 'MS Store',
-            'unknown': 'Unknown'
-        }
-        return formatting_map.get(manager_value, manager_value.capitalize())
+        return MANAGER_DISPLAY_NAMES.get(manager_value, manager_value.capitalize())
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to system clipboard."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self._clipboard.setText(text)
 
         # Show brief feedback, then restore persistent status
         self.status_label.setText(f"Copied to clipboard: {text}")
-        QTimer.singleShot(3000, lambda: self.status_label.setText(self.persistent_status))
+        QTimer.singleShot(3000, self._restore_persistent_status)
+
+    def _restore_persistent_status(self):
+        """Show the persistent status (package count) again after a transient message."""
+        self.status_label.setText(self.persistent_status)
 
     def _show_verbose_output(self, result):
         """
@@ -1800,29 +2350,40 @@ class WinPacManMainWindow(QMainWindow):
         from core.config import config_manager
         import json
 
-        log_file = config_manager.get_data_file_path("operation_history.json")
+        log_file = config_manager.get_data_file_path("operation_history.jsonl")
 
-        # Load existing history
-        history = []
-        if log_file.exists():
+        # Convert the history kept by older versions (one JSON array) once
+        legacy_file = config_manager.get_data_file_path("operation_history.json")
+        if legacy_file.exists() and not log_file.exists():
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
+                with open(legacy_file, 'r', encoding='utf-8') as f:
                     history = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                history = []
-
-        # Add new entry
-        history.append(result.to_dict())
-
-        # Keep only last 100 operations
-        history = history[-100:]
-
-        # Save back
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    for entry in history[-100:]:
+                        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                legacy_file.unlink()
+                print(f"Migrated {len(history[-100:])} operations to {log_file.name}")
+            except (IOError, ValueError, TypeError) as e:
+                print(f"Failed to migrate operation history: {e}")
+
+        # Append one JSON object per line instead of rewriting the whole history
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            with open(log_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result.to_dict(), ensure_ascii=False) + '\n')
+                log_size = f.tell()
         except IOError as e:
             print(f"Failed to log operation: {e}")
+            return
+
+        # Once the file grows past 128 KB, keep only the last 100 operations
+        if log_size > 128 * 1024:
+            try:
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    recent = f.readlines()[-100:]
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    f.writelines(recent)
+            except IOError as e:
+                print(f"Failed to trim operation history: {e}")
 
     def disable_controls(self):
         """Disable controls during operation."""
@@ -1851,11 +2412,8 @@ class WinPacManMainWindow(QMainWindow):
 
     def show_user_guide(self):
         """Show user guide dialog with rendered markdown."""
-        user_guide_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'docs', 'user-guide.md')
-        
         try:
-            with open(user_guide_path, 'r', encoding='utf-8', errors='replace') as f:
-                markdown_content = f.read()
+            markdown_content = _read_help_file(_USER_GUIDE_PATH)
         except Exception as e:
             markdown_content = f"""# WinPacMan User Guide
             
@@ -1901,15 +2459,13 @@ For now, please refer to README.md and CLAUDE.md files in project repository."""
 
     def show_changelog(self):
         """Display CHANGELOG.md with rendered markdown."""
-        changelog_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "CHANGELOG.md")
         
-        if not os.path.exists(changelog_path):
+        if not os.path.exists(_CHANGELOG_PATH):
             QMessageBox.warning(self, "Change Log", "CHANGELOG.md file not found.")
             return
         
         try:
-            with open(changelog_path, 'r', encoding='utf-8', errors='replace') as f:
-                markdown_content = f.read()
+            markdown_content = _read_help_file(_CHANGELOG_PATH)
         except Exception as e:
             markdown_content = f"""# Change Log
             
@@ -1946,25 +2502,8 @@ Error: {str(e)}"""
 
     def show_about(self):
         """Show About dialog with version and date."""
-        import os
-        import re
-
         # Extract version and date/time from CHANGELOG.md
-        changelog_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "CHANGELOG.md")
-        version = "Unknown"
-        date_time = "Unknown"
-
-        if os.path.exists(changelog_path):
-            try:
-                with open(changelog_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for first version line: ## [0.3.0] - 2025-12-26 21:20
-                    match = re.search(r'##\s+\[([^\]]+)\]\s+-\s+(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2})?)', content)
-                    if match:
-                        version = match.group(1)
-                        date_time = match.group(2)
-            except Exception:
-                pass
+        version, date_time = _read_changelog_version()
 
         about_text = f"""<h2>WinPacMan</h2>
 <p><b>Version:</b> {version}</p>
@@ -1989,11 +2528,8 @@ Error: {str(e)}"""
 
     def show_keyboard_shortcuts(self):
         """Show keyboard shortcuts dialog with rendered markdown."""
-        shortcuts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'docs', 'keyboard-shortcuts.md')
-        
         try:
-            with open(shortcuts_path, 'r', encoding='utf-8', errors='replace') as f:
-                markdown_content = f.read()
+            markdown_content = _read_help_file(_SHORTCUTS_PATH)
         except Exception as e:
             # Fallback to embedded content
             markdown_content = f"""# WinPacMan Keyboard Shortcuts
@@ -2113,63 +2649,12 @@ Error: {str(e)}
         """Apply theme from settings."""
         theme = self.settings_service.get_theme()
 
-        # Apply basic stylesheet based on theme
-        if theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                }
-                QWidget {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #1984d8;
-                }
-                QPushButton:disabled {
-                    background-color: #2d2d2d;
-                    color: #666666;
-                }
-                QComboBox {
-                    background-color: #2d2d2d;
-                    color: #ffffff;
-                    border: 1px solid #3d3d3d;
-                    padding: 4px;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QStatusBar {
-                    background-color: #2d2d2d;
-                    color: #ffffff;
-                }
-            """)
-        else:
-            # Light theme or auto (default PyQt6 styling)
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #1984d8;
-                }
-QPushButton:disabled {
-                    background-color: #cccccc;
-                    color: #666666;
-                }
-            """)
+        # Light theme or auto uses default PyQt6 styling plus button colors
+        stylesheet = _DARK_QSS if theme == "dark" else _LIGHT_QSS
+
+        # Setting an identical sheet would still make Qt re-parse and re-polish
+        if self.styleSheet() != stylesheet:
+            self.setStyleSheet(stylesheet)
 
     def restore_window_geometry(self):
         """Restore window size and position from saved settings."""
@@ -2227,9 +2712,63 @@ QPushButton:disabled {
             print(f"[MainWindow] Error saving window geometry: {e}")
 
     def closeEvent(self, event):
-        """Handle window close event - save geometry before closing."""
-        # Save window geometry
-        self.save_window_geometry()
+        """Handle window close event - stop workers and save geometry before closing."""
+        wait_seconds = 0.0
+        if not self._closing:
+            # Confirm before abandoning an install/uninstall or cache refresh
+            if self.operation_in_progress or self._cache_refresh_worker is not None:
+                reply = QMessageBox.question(
+                    self,
+                    "Operation In Progress",
+                    "An operation is still running.\n\n"
+                    "Quit anyway? WinPacMan will close once it has stopped.",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    event.ignore()
+                    return
+
+            self._closing = True
+
+            # Save window geometry
+            self.save_window_geometry()
+
+            # Ask every worker to stop; results arriving later are dropped
+            self._package_worker.cancel()
+            self._worker_thread.quit()
+            if self.current_worker is not None:
+                self.current_worker.cancel()
+            for worker in self._search_workers:
+                worker.cancel()
+
+            self.status_label.setText("Stopping background tasks...")
+            self.status_label.repaint()
+            wait_seconds = _CLOSE_WAIT_SECONDS
+
+        # Wait briefly (one shared deadline) for the threads to stop
+        threads = [self._worker_thread, self.current_worker, self._cache_refresh_worker]
+        threads = [thread for thread in threads + self._search_workers if thread is not None]
+        deadline = time.monotonic() + wait_seconds
+        for thread in threads:
+            thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+
+        # A long install or cache refresh can't be interrupted: keep the window
+        # open (disabled) and retry closing until the remaining threads exit
+        running = [thread for thread in threads if thread.isRunning()]
+        if running:
+            if wait_seconds:
+                print(f"[MainWindow] Waiting for {len(running)} background task(s) before exiting")
+                self.status_label.setText("Waiting for the running operation to finish before exiting...")
+                self.centralWidget().setEnabled(False)
+                self.menuBar().setEnabled(False)
+            QTimer.singleShot(250, self.close)
+            event.ignore()
+            return
+
+        # Close the GUI thread's cache connection (only if the cache was created)
+        if 'metadata_cache' in self.__dict__:
+            self.metadata_cache.close()
 
         # Accept the close event
         event.accept()
@@ -2274,38 +2813,20 @@ QPushButton:disabled {
         Returns:
             Fully styled HTML string with CSS
         """
+        # Rendered documents only depend on the text and the theme
+        cache_key = (markdown_text, self.is_dark_theme())
+        cached_html = self._md_html_cache.get(cache_key)
+        if cached_html is not None:
+            return cached_html
+
         # Get theme colors for styling
         theme_colors = self.get_dialog_theme_colors()
         
-        # Configure markdown extensions (GitHub-flavored)
-        extensions = [
-            'fenced_code',      # ```code blocks```
-            'tables',           # GitHub markdown tables
-            'nl2br',            # Convert newlines to <br>
-            'sane_lists',       # Better list handling
-            'codehilite',       # Syntax highlighting
-            'toc',              # Table of contents support
-        ]
-        
-        # Configure extension settings
-        extension_configs = {
-            'codehilite': {
-                'css_class': 'highlight',
-                'linenums': False,
-                'guess_lang': True
-            }
-        }
-        
-        # Convert markdown to HTML
-        md = markdown.Markdown(
-            extensions=extensions,
-            extension_configs=extension_configs
-        )
-        html_content = md.convert(markdown_text)
+        # Convert markdown to HTML (shared converter, reset between documents)
+        html_content = _get_markdown().reset().convert(markdown_text)
         
         # Get Pygments CSS for syntax highlighting
-        formatter = HtmlFormatter(style='github-dark' if self.is_dark_theme() else 'github')
-        pygments_css = formatter.get_style_defs('.highlight')
+        pygments_css = _get_pygments_css('github-dark' if self.is_dark_theme() else 'github')
         
         # Build complete HTML document with GitHub-style CSS
         full_html = f"""
@@ -2446,4 +2967,5 @@ QPushButton:disabled {
 </html>
 """
         
+        self._md_html_cache[cache_key] = full_html
         return full_html
@@ -5,16 +5,34 @@ This module provides QThread-based workers for non-blocking package operations.
 Uses PyQt6 signals for thread-safe communication with the UI.
 """
 
-from .signals import PackageSignals
+from .signals import (
+    PackageSignals,
+    InstallPathSignals,
+    VersionInfoSignals,
+    CacheRefreshSignals,
+    SearchSignals
+)
 from .package_worker import (
     PackageListWorker,
-    PackageInstallWorker,
-    PackageUninstallWorker
+    PackageOperationWorker
 )
+from .install_path_worker import InstallPathWorker
+from .version_info_worker import VersionInfoWorker
+from .cache_refresh_worker import CacheRefreshWorker
+from .installed_packages_worker import InstalledPackagesWorker
+from .search_worker import SearchWorker
 
 __all__ = [
     'PackageSignals',
+    'InstallPathSignals',
+    'VersionInfoSignals',
+    'CacheRefreshSignals',
+    'SearchSignals',
     'PackageListWorker',
-    'PackageInstallWorker',
-    'PackageUninstallWorker'
+    'PackageOperationWorker',
+    'InstallPathWorker',
+    'VersionInfoWorker',
+    'CacheRefreshWorker',
+    'InstalledPackagesWorker',
+    'SearchWorker'
 ]
@@ -0,0 +1,67 @@
+"""
+QThread-based worker for metadata cache refreshes.
+
+Refreshing a provider runs its package manager (winget, choco, scoop, ...)
+and writes the results to SQLite, which can take tens of seconds, so it
+must not run on the GUI thread.
+"""
+
+from PyQt6.QtCore import QThread
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+
+from metadata import MetadataCacheService
+from utils.system_utils import WindowsPowerManager
+from .signals import CacheRefreshSignals
+
+
+class CacheRefreshWorker(QThread):
+    """
+    Worker for refreshing the metadata cache in a background thread.
+
+    Each requested manager is refreshed with force=True. Providers are
+    independent and I/O-bound, so they run concurrently; the service
+    serializes the actual database writes.
+    """
+
+    def __init__(self, service: MetadataCacheService, managers: List[str]):
+        """
+        Initialize the worker.
+
+        Args:
+            service: MetadataCacheService instance
+            managers: Manager names to refresh, e.g. ['winget', 'scoop']
+        """
+        super().__init__()
+        self.service = service
+        self.managers = list(managers)
+        self.signals = CacheRefreshSignals()
+
+    def _refresh_one(self, manager: str):
+        """Refresh a single provider (runs in a pool thread)."""
+        print(f"[CacheRefreshWorker] Refreshing {manager}")
+        self.signals.progress.emit(manager)
+        self.service.refresh_cache(manager=manager, force=True)
+
+    def run(self):
+        """Execute the cache refresh in background thread."""
+        try:
+            # Prevent system sleep while the providers are refreshed
+            with WindowsPowerManager.prevent_sleep():
+                with ThreadPoolExecutor(max_workers=max(1, len(self.managers))) as executor:
+                    futures = {
+                        executor.submit(self._refresh_one, manager): manager
+                        for manager in self.managers
+                    }
+                    for future in as_completed(futures):
+                        manager = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            print(f"[CacheRefreshWorker] ERROR: {manager}: {type(e).__name__}: {str(e)}")
+                            self.signals.error_occurred.emit(manager, str(e))
+                        else:
+                            count = self.service.get_package_count(manager)
+                            self.signals.manager_done.emit(manager, count)
+        finally:
+            self.signals.finished.emit()
@@ -0,0 +1,44 @@
+"""
+QRunnable-based worker for install location lookups.
+
+Resolving a package's install location walks the Windows Registry
+Uninstall keys and may fall back to `winget show`, so it runs on the
+global QThreadPool instead of the GUI thread.
+"""
+
+from PyQt6.QtCore import QRunnable
+from typing import Callable, Optional
+
+from .signals import InstallPathSignals
+
+
+class InstallPathWorker(QRunnable):
+    """
+    Worker for resolving a package's install location in the thread pool.
+
+    Calls the supplied resolver in a pool thread and emits
+    install_path_ready with the result.
+    """
+
+    def __init__(self, package_id: str, resolver: Callable[[str], Optional[str]]):
+        """
+        Initialize the worker.
+
+        Args:
+            package_id: Package ID to look up
+            resolver: Callable mapping a package ID to an install path (or None)
+        """
+        super().__init__()
+        self.package_id = package_id
+        self.resolver = resolver
+        self.signals = InstallPathSignals()
+
+    def run(self):
+        """Execute install location lookup in a pool thread."""
+        path = None
+        try:
+            path = self.resolver(self.package_id)
+        except Exception as e:
+            print(f"[InstallPathWorker] ERROR: {type(e).__name__}: {str(e)}")
+        finally:
+            self.signals.install_path_ready.emit(self.package_id, path)
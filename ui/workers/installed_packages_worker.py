@@ -0,0 +1,76 @@
+"""
+QThread-based worker for refreshing the installed packages list.
+
+Scanning the Windows Registry and converting the cached rows to Package
+objects takes long enough to stall the window, so it runs off the GUI
+thread and reports back through PackageSignals.
+"""
+
+from PyQt6.QtCore import QThread
+from typing import List, Optional
+
+from metadata import MetadataCacheService
+from .signals import PackageSignals
+
+
+class InstalledPackagesWorker(QThread):
+    """
+    Worker for loading installed packages in background thread.
+
+    Optionally re-syncs the installed packages cache from the registry,
+    then emits packages_loaded with Package objects for the requested
+    managers.
+    """
+
+    def __init__(self, cache: MetadataCacheService,
+                 managers: Optional[List[str]] = None, sync: bool = True):
+        """
+        Initialize the worker.
+
+        Args:
+            cache: MetadataCacheService instance
+            managers: Managers to include (None = all)
+            sync: Scan the Windows Registry before reading the cache
+        """
+        super().__init__()
+        self.cache = cache
+        self.managers = managers
+        self.sync = sync
+        self.signals = PackageSignals()
+        self._is_cancelled = False
+
+    def run(self):
+        """Execute the installed packages refresh in background thread."""
+        try:
+            self.signals.started.emit()
+
+            if self.sync:
+                print("[InstalledPackagesWorker] Syncing installed packages from registry")
+                self.cache.sync_installed_packages_from_registry(validate=True)
+
+            installed = self.cache.get_installed_packages(managers=self.managers)
+
+            # Convert to Package objects with smart manager resolution
+            packages = self.cache.build_packages(installed)
+
+            if not self._is_cancelled:
+                self.signals.packages_loaded.emit(packages)
+
+        except Exception as e:
+            print(f"[InstalledPackagesWorker] ERROR: {type(e).__name__}: {str(e)}")
+            if not self._is_cancelled:
+                self.signals.error_occurred.emit(str(e))
+            import traceback
+            traceback.print_exc()
+
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        """
+        Cancel the operation.
+
+        Note: This only suppresses the result; a running registry scan
+        is not interrupted.
+        """
+        self._is_cancelled = True
@@ -1,11 +1,12 @@
 """
-QThread-based workers for package operations.
+Workers for package operations.
 
-Replaces threading.Thread-based PackageOperationWorker with PyQt6 QThread
-workers that use signals for thread-safe communication.
+PackageListWorker is a QThread for listing installed packages; installs
+and uninstalls run on the long-lived PackageOperationWorker. Both use
+signals for thread-safe communication.
 """
 
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QThread, QObject, pyqtSlot
 from typing import Callable, Optional, List
 
 from core.models import Package, PackageManager, OperationResult
@@ -88,125 +89,68 @@ class PackageListWorker(QThread):
         self.quit()
 
 
-class PackageInstallWorker(QThread):
+class PackageOperationWorker(QObject):
     """
-    Worker for installing packages in background thread.
+    Long-lived worker for package operations on a persistent QThread.
 
-    This worker calls PackageManagerService.install_package() and emits
-    signals for progress and completion.
+    Instead of creating and starting a QThread per operation, one instance
+    is moved onto a thread that stays alive for the session. Operations are
+    queued by emitting signals connected to the slots below, so they run in
+    the worker thread's event loop one at a time.
     """
 
-    def __init__(self, service: PackageManagerService,
-                 manager: PackageManager, package_id: str):
+    def __init__(self, service: PackageManagerService):
         """
         Initialize the worker.
 
         Args:
             service: PackageManagerService instance
-            manager: Package manager to use
-            package_id: ID of package to install
         """
         super().__init__()
         self.service = service
-        self.manager = manager
-        self.package_id = package_id
         self.signals = PackageSignals()
         self._is_cancelled = False
 
-    def run(self):
-        """Execute package installation in background thread."""
+    def _progress_callback(self, current: int, total: int, message: str):
+        """Forward service progress as a signal unless cancelled."""
+        if not self._is_cancelled:
+            self.signals.progress.emit(current, total, message)
+
+    @pyqtSlot(object, str)
+    def install(self, manager: PackageManager, package_id: str):
+        """Install a package."""
+        self._is_cancelled = False
         try:
             self.signals.started.emit()
-
-            # Progress callback that emits signals
-            def progress_callback(current: int, total: int, message: str):
-                if not self._is_cancelled:
-                    self.signals.progress.emit(current, total, message)
-
-            # Call service layer (blocking operation)
-            result = self.service.install_package(
-                self.manager,
-                self.package_id,
-                progress_callback
-            )
-
-            # Emit result if not cancelled
+            result = self.service.install_package(manager, package_id, self._progress_callback)
             if not self._is_cancelled:
                 self.signals.operation_complete.emit(result)
-
         except Exception as e:
-            # Emit error if not cancelled
             if not self._is_cancelled:
-                error_msg = f"Failed to install package: {str(e)}"
-                self.signals.error_occurred.emit(error_msg)
-
+                self.signals.error_occurred.emit(f"Failed to install package: {str(e)}")
         finally:
-            # Always emit finished signal
             self.signals.finished.emit()
 
-    def cancel(self):
-        """Cancel the operation."""
-        self._is_cancelled = True
-        self.quit()
-
-
-class PackageUninstallWorker(QThread):
-    """
-    Worker for uninstalling packages in background thread.
-
-    This worker calls PackageManagerService.uninstall_package() and emits
-    signals for progress and completion.
-    """
-
-    def __init__(self, service: PackageManagerService,
-                 manager: PackageManager, package_id: str):
-        """
-        Initialize the worker.
-
-        Args:
-            service: PackageManagerService instance
-            manager: Package manager to use
-            package_id: ID of package to uninstall
-        """
-        super().__init__()
-        self.service = service
-        self.manager = manager
-        self.package_id = package_id
-        self.signals = PackageSignals()
+    @pyqtSlot(object, str)
+    def uninstall(self, manager: PackageManager, package_id: str):
+        """Uninstall a package."""
         self._is_cancelled = False
-
-    def run(self):
-        """Execute package uninstallation in background thread."""
         try:
             self.signals.started.emit()
-
-            # Progress callback that emits signals
-            def progress_callback(current: int, total: int, message: str):
-                if not self._is_cancelled:
-                    self.signals.progress.emit(current, total, message)
-
-            # Call service layer (blocking operation)
-            result = self.service.uninstall_package(
-                self.manager,
-                self.package_id,
-                progress_callback
-            )
-
-            # Emit result if not cancelled
+            result = self.service.uninstall_package(manager, package_id, self._progress_callback)
             if not self._is_cancelled:
                 self.signals.operation_complete.emit(result)
-
         except Exception as e:
-            # Emit error if not cancelled
             if not self._is_cancelled:
-                error_msg = f"Failed to uninstall package: {str(e)}"
-                self.signals.error_occurred.emit(error_msg)
-
+                self.signals.error_occurred.emit(f"Failed to uninstall package: {str(e)}")
         finally:
-            # Always emit finished signal
             self.signals.finished.emit()
 
     def cancel(self):
-        """Cancel the operation."""
+        """
+        Cancel the running operation.
+
+        Note: Results are dropped, but the subprocess cannot be interrupted.
+        Called from the GUI thread; the flag is reset when the next operation starts.
+        """
         self._is_cancelled = True
-        self.quit()
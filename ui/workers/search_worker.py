@@ -0,0 +1,68 @@
+"""
+QThread-based worker for metadata cache searches.
+
+The FTS query and the conversion of results to Package objects both hit
+SQLite, which can take hundreds of milliseconds on a cold page cache, so
+searches run off the GUI thread.
+"""
+
+from PyQt6.QtCore import QThread
+from typing import List, Optional
+
+from metadata import MetadataCacheService
+from .signals import SearchSignals
+
+
+class SearchWorker(QThread):
+    """
+    Worker for searching the metadata cache in background thread.
+
+    Calls MetadataCacheService.search() and emits results_ready with
+    Package objects and the query they answer.
+    """
+
+    def __init__(self, cache: MetadataCacheService, query: str,
+                 managers: Optional[List[str]] = None, limit: int = 100):
+        """
+        Initialize the worker.
+
+        Args:
+            cache: MetadataCacheService instance
+            query: Search query string
+            managers: Managers to search (None = all)
+            limit: Maximum results to return
+        """
+        super().__init__()
+        self.cache = cache
+        self.query = query
+        self.managers = managers
+        self.limit = limit
+        self.signals = SearchSignals()
+        self._is_cancelled = False
+
+    def run(self):
+        """Execute the search in background thread."""
+        try:
+            results = self.cache.search(self.query, managers=self.managers, limit=self.limit)
+
+            # Convert to Package objects
+            packages = self.cache.build_packages(results)
+
+            if not self._is_cancelled:
+                self.signals.results_ready.emit(packages, self.query)
+
+        except Exception as e:
+            print(f"[SearchWorker] ERROR: {type(e).__name__}: {str(e)}")
+            if not self._is_cancelled:
+                self.signals.error_occurred.emit(str(e), self.query)
+            import traceback
+            traceback.print_exc()
+
+    def cancel(self):
+        """
+        Cancel the search.
+
+        Note: This only suppresses the result; a running SQLite query
+        is not interrupted.
+        """
+        self._is_cancelled = True
@@ -57,3 +57,95 @@ class PackageSignals(QObject):
 
     finished = pyqtSignal()
     """Emitted when operation finishes (success or failure)."""
+
+
+class InstallPathSignals(QObject):
+    """
+    Signals for install location lookups.
+
+    QRunnable is not a QObject, so thread pool workers carry their
+    signals on this helper object instead.
+    """
+
+    install_path_ready = pyqtSignal(str, object)  # package_id, Optional[str]
+    """
+    Emitted when an install location lookup completes.
+    Args:
+        package_id (str): Package ID that was looked up
+        path (Optional[str]): Installation directory, or None if not found
+    """
+
+
+class VersionInfoSignals(QObject):
+    """
+    Signals for the version label lookup.
+
+    Carried on a helper QObject for the same reason as InstallPathSignals.
+    """
+
+    version_info_ready = pyqtSignal(str)  # formatted version string
+    """
+    Emitted when the version string has been read from CHANGELOG.md.
+    Args:
+        version_info (str): Display string, e.g. "v0.5.4a (2025-12-31)"
+    """
+
+
+class CacheRefreshSignals(QObject):
+    """
+    Signals for metadata cache refreshes.
+
+    Emitted from the refresh worker (and its provider threads) and
+    delivered to the main thread through queued connections.
+    """
+
+    progress = pyqtSignal(str)            # manager name
+    """
+    Emitted when a provider starts refreshing.
+    Args:
+        manager (str): Manager name, e.g. "winget"
+    """
+
+    manager_done = pyqtSignal(str, int)   # manager name, cached package count
+    """
+    Emitted when a provider's cache has been refreshed.
+    Args:
+        manager (str): Manager name
+        count (int): Number of packages now cached for the manager
+    """
+
+    error_occurred = pyqtSignal(str, str)  # manager name, error message
+    """
+    Emitted when a provider refresh fails.
+    Args:
+        manager (str): Manager name
+        message (str): Error message
+    """
+
+    finished = pyqtSignal()
+    """Emitted when all requested providers have been processed."""
+
+
+class SearchSignals(QObject):
+    """
+    Signals for metadata cache searches.
+
+    Results carry the query they answer, so the window can drop results
+    from a search that has since been superseded.
+    """
+
+    results_ready = pyqtSignal(list, str)  # List[Package], query
+    """
+    Emitted when a search completes.
+    Args:
+        packages (list): Matching Package objects
+        query (str): Query the results belong to
+    """
+
+    error_occurred = pyqtSignal(str, str)  # error message, query
+    """
+    Emitted when a search fails.
+    Args:
+        message (str): Error message
+        query (str): Query that failed
+    """
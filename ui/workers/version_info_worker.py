@@ -0,0 +1,40 @@
+"""
+QRunnable-based worker for the version label.
+
+Reading CHANGELOG.md at startup is file I/O the window does not need
+before its first paint, so it runs on the global QThreadPool.
+"""
+
+from PyQt6.QtCore import QRunnable
+from typing import Callable
+
+from .signals import VersionInfoSignals
+
+
+class VersionInfoWorker(QRunnable):
+    """
+    Worker for reading the application version in the thread pool.
+
+    Calls the supplied reader in a pool thread and emits
+    version_info_ready with the result.
+    """
+
+    def __init__(self, reader: Callable[[], str]):
+        """
+        Initialize the worker.
+
+        Args:
+            reader: Callable returning the formatted version string
+        """
+        super().__init__()
+        self.reader = reader
+        self.signals = VersionInfoSignals()
+
+    def run(self):
+        """Execute version lookup in a pool thread."""
+        try:
+            version_info = self.reader()
+        except Exception as e:
+            print(f"[VersionInfoWorker] ERROR: {type(e).__name__}: {str(e)}")
+            return
+        self.signals.version_info_ready.emit(version_info)